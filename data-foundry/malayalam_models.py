@@ -5,10 +5,13 @@ Quick deployment of state-of-the-art Malayalam AI models for IVR enhancement
 """
 
 import asyncio
+import dataclasses
+import hashlib
+import fnmatch
 import logging
 import torch
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 import numpy as np
 import soundfile as sf
@@ -20,17 +23,28 @@ try:
         AutoTokenizer, 
         AutoProcessor,
         AutoModelForSpeechSeq2Seq,
+        AutoModelForSeq2SeqLM,
         AutoFeatureExtractor,
         Wav2Vec2ForCTC,
         Wav2Vec2Processor,
-        AutoModelForSequenceClassification
+        AutoModelForSequenceClassification,
+        AutoModelForMaskedLM,
+        BitsAndBytesConfig
     )
     from accelerate import Accelerator
+    from huggingface_hub import list_repo_files, snapshot_download
 except ImportError as e:
     logging.error(f"Required packages not installed: {e}")
     logging.error("Install with: pip install transformers accelerate torch torchaudio soundfile")
     exit(1)
 
+# 8-bit weight loading for the encoder models on GPU (optional)
+try:
+    import bitsandbytes  # noqa: F401
+    BITSANDBYTES_AVAILABLE = True
+except ImportError:
+    BITSANDBYTES_AVAILABLE = False
+
 # Cloud API imports (optional)
 try:
     from google.cloud import speech_v1p1beta1 as speech
@@ -93,8 +107,7 @@ class VertexAIClient:
 
         try:
             # Read audio file
-            with open(audio_file_path, "rb") as audio_file:
-                content = audio_file.read()
+            content = await asyncio.to_thread(Path(audio_file_path).read_bytes)
 
             # Configure recognition
             config = speech.RecognitionConfig(
@@ -109,8 +122,8 @@ class VertexAIClient:
 
             audio = speech.RecognitionAudio(content=content)
 
-            # Perform transcription
-            response = self.client.recognize(config=config, audio=audio)
+            # Perform transcription (blocking gRPC call, kept off the event loop)
+            response = await asyncio.to_thread(self.client.recognize, config=config, audio=audio)
 
             if response.results:
                 result = response.results[0]
@@ -155,8 +168,9 @@ class AssemblyAIClient:
             return {"error": "AssemblyAI client not initialized", "success": False}
 
         try:
-            # Upload and transcribe
-            transcript = self.client.transcripts.transcribe(
+            # Upload and transcribe (blocks until the transcript is ready, so run it in a thread)
+            transcript = await asyncio.to_thread(
+                self.client.transcripts.transcribe,
                 audio=audio_file_path,
                 language_code="ml",  # Malayalam
                 punctuate=True,
@@ -164,7 +178,6 @@ class AssemblyAIClient:
                 speaker_labels=True
             )
 
-            # Wait for completion (this is synchronous in the current implementation)
             if transcript.status == "completed":
                 return {
                     "transcription": transcript.text,
@@ -191,6 +204,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batch size for batched inference (HF pipelines and translation generate calls)
+PIPELINE_BATCH_SIZE = 16
+
+# Upper bound on generated tokens per translated text
+TRANSLATION_MAX_NEW_TOKENS = 128
+
+# Common IVR intent patterns in Malayalam
+IVR_INTENT_PATTERNS = {
+    "complaint": ["പരാതി", "പ്രശ്നം", "കുഴപ്പം", "തകരാർ"],
+    "inquiry": ["അന്വേഷണം", "വിവരം", "ചോദ്യം", "അറിയാൻ"],
+    "request": ["അപേക്ഷ", "ആവശ്യം", "വേണം", "കിട്ടുമോ"],
+    "greeting": ["ഹലോ", "നമസ്കാരം", "വന്ദനം"],
+    "goodbye": ["വിട", "പോകാം", "കാണാം"]
+}
+
+# Model families and the MalayalamModelManager method that loads each one
+MODEL_LOADERS = {
+    'stt': '_load_stt_model',
+    'nlu': '_load_nlu_model',
+    'translation': '_load_translation_model',
+    'sentiment': '_load_sentiment_model',
+    'tts': '_load_tts_model'
+}
+
+# Primary checkpoint of each model family, fetched ahead of loading by _prefetch()
+MODEL_PRIMARY_CHECKPOINTS = {
+    'stt': 'stt_model_large',
+    'nlu': 'nlu_model',
+    'translation': 'translation_model',
+    'sentiment': 'sentiment_model',
+    'tts': 'tts_model'
+}
+
+# Top-level repo files prefetched besides the weights: configs, tokenizers and vocabularies
+PREFETCH_FILE_PATTERNS = ("*.json", "*.txt", "*.model", "*.spm", "*.tiktoken")
+
+# Weight files in the order from_pretrained prefers them; only the first format present is fetched
+PREFETCH_WEIGHT_PATTERNS = ("*.safetensors", "pytorch_model*.bin")
+
+# Model family each analyze_batch task runs on
+BATCH_TASK_MODELS = {
+    "intent": "nlu",
+    "translation": "translation",
+    "sentiment": "sentiment"
+}
+
+# Class ids of the sentiment model
+SENTIMENT_LABELS = {0: 'negative', 1: 'neutral', 2: 'positive'}
+
+
+def _match_intent(malayalam_text: str) -> Tuple[str, float]:
+    """Simple keyword matching for intent classification"""
+    for intent, keywords in IVR_INTENT_PATTERNS.items():
+        for keyword in keywords:
+            if keyword in malayalam_text:
+                return intent, 0.8  # Simple confidence score
+    return "unknown", 0.0
+
+
+def _mask_first_word(text: str) -> str:
+    """Mask a word to understand context"""
+    return text.replace(text.split()[0], "[MASK]", 1)
+
 @dataclass
 class ModelConfig:
     """Configuration for Malayalam AI models using AI4Bharat's latest models with open alternatives"""
@@ -237,6 +313,9 @@ class ModelConfig:
     vertex_location: str = "asia-south1"  # Best region for Malayalam
     use_cloud_apis_first: bool = True  # Try cloud APIs before local models
 
+    # Load the NLU and sentiment encoders with int8 weights (bitsandbytes on GPU, dynamic quantization on CPU)
+    quantize_encoders: bool = True
+
     # Voice characteristics for human-like conversation
     voice_config: Optional[Dict[str, Any]] = None
     
@@ -260,6 +339,10 @@ class MalayalamModelManager:
     def __init__(self, config: Optional[ModelConfig] = None):
         self.config = config or ModelConfig()
         self.models: Dict[str, Any] = {}
+        self.initialization_results: Dict[str, bool] = {}
+        
+        # Model loads in flight, shared by every caller that needs the same model
+        self._model_loads: Dict[str, "asyncio.Future"] = {}
         self.accelerator = Accelerator()
         self.cache_dir = Path(self.config.cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
@@ -316,7 +399,108 @@ class MalayalamModelManager:
                 initialization_results['assemblyai'] = False
                 logger.warning("⚠️ AssemblyAI not available")
         
-        # Load Primary STT Model (AI4Bharat Large)
+        initialization_results.update(await self.preload())
+            
+        success_count = sum(initialization_results.values())
+        total_count = len(initialization_results)
+        
+        logger.info(f"🎉 Model initialization complete: {success_count}/{total_count} models loaded successfully")
+        self.initialization_results.update(initialization_results)
+        return initialization_results
+
+    async def preload(self, model_names: Optional[Sequence[str]] = None) -> Dict[str, bool]:
+        """
+        Load the given model families now instead of on first use, retrying any that failed before
+        
+        Args:
+            model_names: Any of "stt", "nlu", "translation", "sentiment", "tts" (default: all)
+            
+        Returns:
+            Dict mapping each requested model to whether it is loaded
+        """
+        model_names = list(MODEL_LOADERS) if model_names is None else list(model_names)
+        unknown_models = [name for name in model_names if name not in MODEL_LOADERS]
+        if unknown_models:
+            raise ValueError(f"Unknown models: {unknown_models}")
+        
+        await self._prefetch(model_names)
+        
+        # The model loads are independent downloads and from_pretrained calls, so they
+        # run concurrently on worker threads instead of one after another
+        loaded = await asyncio.gather(*(self._ensure_model(name, retry_failed=True) for name in model_names))
+        return dict(zip(model_names, loaded))
+
+    async def _prefetch(self, model_names: Sequence[str]) -> None:
+        """
+        Download the primary checkpoints of models not yet loaded into the cache, all at once
+        
+        Failures (gated or missing repos, offline hosts) are only logged; the loaders then
+        walk their fallback chains as before.
+        """
+        model_ids = sorted({
+            getattr(self.config, MODEL_PRIMARY_CHECKPOINTS[name])
+            for name in model_names
+            if not self.initialization_results.get(name) and name not in self._model_loads
+        })
+        if not model_ids:
+            return
+        
+        logger.info(f"⬇️ Prefetching {len(model_ids)} model snapshots...")
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._prefetch_snapshot, model_id) for model_id in model_ids),
+            return_exceptions=True
+        )
+        for model_id, result in zip(model_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Could not prefetch {model_id}: {result}")
+
+    def _prefetch_snapshot(self, model_id: str) -> str:
+        """Download a repo's top-level config/tokenizer files and one weight format (blocking; run via asyncio.to_thread)"""
+        # Only top-level files: checkpoint subfolders and alternative weight formats are
+        # never read by from_pretrained and can double the download
+        top_level_files = [name for name in list_repo_files(model_id) if "/" not in name]
+        allow_files = [
+            name for name in top_level_files
+            if any(fnmatch.fnmatch(name, pattern) for pattern in PREFETCH_FILE_PATTERNS)
+        ]
+        for pattern in PREFETCH_WEIGHT_PATTERNS:
+            weight_files = fnmatch.filter(top_level_files, pattern)
+            if weight_files:
+                allow_files.extend(weight_files)
+                break
+        
+        return snapshot_download(model_id, cache_dir=self.cache_dir, allow_patterns=allow_files)
+
+    async def _ensure_model(self, model_name: str, retry_failed: bool = False) -> bool:
+        """
+        Load a model family on first use; later calls return the recorded outcome
+        
+        A failed load is retried only when retry_failed is set (preload/initialize_models),
+        so per-request calls do not re-attempt a broken download every time.
+        """
+        loaded = self.initialization_results.get(model_name)
+        if loaded or (loaded is False and not retry_failed):
+            return loaded
+        
+        load = self._model_loads.get(model_name)
+        if load is None:
+            load = asyncio.ensure_future(asyncio.to_thread(getattr(self, MODEL_LOADERS[model_name])))
+            self._model_loads[model_name] = load
+        try:
+            # shield() keeps one caller's cancellation from aborting the load for the others
+            loaded = await asyncio.shield(load)
+        except Exception as e:
+            logger.error(f"❌ Unexpected error while loading {model_name} model: {e}")
+            loaded = False
+        finally:
+            if load.done():
+                self._model_loads.pop(model_name, None)
+        
+        self.initialization_results[model_name] = loaded
+        return loaded
+        
+    def _load_stt_model(self) -> bool:
+        """Load the primary STT model, walking the open-model fallback chain (blocking; run via asyncio.to_thread)"""
         try:
             logger.info("📢 Loading AI4Bharat Malayalam STT Large model...")
             self.models['stt_processor'] = AutoProcessor.from_pretrained(
@@ -327,7 +511,7 @@ class MalayalamModelManager:
                 self.config.stt_model_large,
                 cache_dir=self.cache_dir
             ).to(self.config.device)
-            initialization_results['stt'] = True
+            loaded = True
             logger.info("✅ AI4Bharat Malayalam STT Large model loaded successfully")
 
         except Exception as e:
@@ -343,7 +527,7 @@ class MalayalamModelManager:
                     self.config.stt_model_multilingual,
                     cache_dir=self.cache_dir
                 ).to(self.config.device)
-                initialization_results['stt'] = True
+                loaded = True
                 logger.info("✅ AI4Bharat Multilingual STT fallback loaded successfully")
             except Exception as fallback_e:
                 logger.error(f"❌ Failed to load AI4Bharat fallback STT model: {fallback_e}")
@@ -358,7 +542,7 @@ class MalayalamModelManager:
                         self.config.stt_model_whisper,
                         cache_dir=self.cache_dir
                     ).to(self.config.device)
-                    initialization_results['stt'] = True
+                    loaded = True
                     logger.info("✅ Whisper Malayalam STT loaded successfully (open alternative)")
                 except Exception as whisper_e:
                     logger.error(f"❌ Failed to load Whisper STT: {whisper_e}")
@@ -373,7 +557,7 @@ class MalayalamModelManager:
                             self.config.stt_model_wav2vec_vakyansh,
                             cache_dir=self.cache_dir
                         ).to(self.config.device)
-                        initialization_results['stt'] = True
+                        loaded = True
                         logger.info("✅ Vakyansh wav2vec2 Malayalam STT loaded successfully (open alternative)")
                     except Exception as vakyansh_e:
                         logger.error(f"❌ Failed to load Vakyansh wav2vec2 STT: {vakyansh_e}")
@@ -388,22 +572,20 @@ class MalayalamModelManager:
                                 self.config.stt_model_wav2vec_addy,
                                 cache_dir=self.cache_dir
                             ).to(self.config.device)
-                            initialization_results['stt'] = True
+                            loaded = True
                             logger.info("✅ Addy wav2vec2 Malayalam STT loaded successfully (final fallback)")
                         except Exception as final_stt_e:
                             logger.error(f"❌ Failed to load any STT model: {final_stt_e}")
-                            initialization_results['stt'] = False
-            
-        # Load NLU Model (Language Understanding)
+                            loaded = False
+
+        return loaded
+
+    def _load_nlu_model(self) -> bool:
+        """Load the Malayalam NLU fill-mask pipeline, falling back to Malayalam BERT (blocking; run via asyncio.to_thread)"""
         try:
             logger.info("🧠 Loading Malayalam NLU model...")
-            self.models['nlu'] = pipeline(
-                "fill-mask",
-                model=self.config.nlu_model,
-                device=0 if self.config.device == "cuda" else -1,
-                model_kwargs={"cache_dir": self.cache_dir}
-            )
-            initialization_results['nlu'] = True
+            self.models['nlu'] = self._build_fill_mask_pipeline(self.config.nlu_model)
+            loaded = True
             logger.info("✅ Malayalam NLU model loaded successfully")
 
         except Exception as e:
@@ -411,55 +593,103 @@ class MalayalamModelManager:
             # Try open alternative: Malayalam BERT
             try:
                 logger.info("🧠 Trying open alternative: Malayalam BERT for NLU...")
-                self.models['nlu'] = pipeline(
-                    "fill-mask",
-                    model=self.config.nlu_model_bert,
-                    device=0 if self.config.device == "cuda" else -1,
-                    model_kwargs={"cache_dir": self.cache_dir}
-                )
-                initialization_results['nlu'] = True
+                self.models['nlu'] = self._build_fill_mask_pipeline(self.config.nlu_model_bert)
+                loaded = True
                 logger.info("✅ Malayalam BERT NLU loaded successfully (open alternative)")
             except Exception as bert_e:
                 logger.error(f"❌ Failed to load Malayalam BERT NLU: {bert_e}")
-                initialization_results['nlu'] = False
-            
-        # Load Translation Model
+                loaded = False
+
+        return loaded
+
+    def _load_encoder(self, model_class, model_name: str):
+        """
+        Load an encoder-only model for inference, with int8 weights when quantize_encoders is set
+        
+        GPU hosts load 8-bit weights through bitsandbytes (fp16 when it is not installed);
+        CPU hosts apply dynamic int8 quantization to the Linear layers.
+        """
+        if not self.config.quantize_encoders:
+            return model_class.from_pretrained(model_name, cache_dir=self.cache_dir).to(self.config.device).eval()
+        
+        if self.config.device == "cuda":
+            if BITSANDBYTES_AVAILABLE:
+                return model_class.from_pretrained(
+                    model_name,
+                    cache_dir=self.cache_dir,
+                    quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                    device_map="auto"
+                ).eval()
+            return model_class.from_pretrained(
+                model_name,
+                cache_dir=self.cache_dir,
+                torch_dtype=torch.float16
+            ).to(self.config.device).eval()
+        
+        model = model_class.from_pretrained(model_name, cache_dir=self.cache_dir).eval()
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def _build_fill_mask_pipeline(self, model_name: str):
+        """Fill-mask pipeline over a (possibly quantized) masked-LM encoder"""
+        model = self._load_encoder(AutoModelForMaskedLM, model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name, cache_dir=self.cache_dir)
+        
+        # Models placed by device_map must not be moved again by the pipeline
+        device_kwargs = {} if hasattr(model, "hf_device_map") else {"device": 0 if self.config.device == "cuda" else -1}
+        return pipeline(
+            "fill-mask",
+            model=model,
+            tokenizer=tokenizer,
+            batch_size=PIPELINE_BATCH_SIZE,
+            **device_kwargs
+        )
+
+    def _load_translation_model(self) -> bool:
+        """Load the Malayalam-English translation tokenizer and model (blocking; run via asyncio.to_thread)"""
         try:
             logger.info("🌐 Loading Malayalam-English translation model...")
-            self.models['translation'] = pipeline(
-                "translation",
-                model=self.config.translation_model,
-                device=0 if self.config.device == "cuda" else -1,
-                model_kwargs={"cache_dir": self.cache_dir}
+            # Tokenizer + model.generate directly: a padded batch is one generate call,
+            # where the translation pipeline loops over inputs one forward pass at a time
+            self.models['translation_tokenizer'] = AutoTokenizer.from_pretrained(
+                self.config.translation_model,
+                cache_dir=self.cache_dir
             )
-            initialization_results['translation'] = True
+            self.models['translation'] = AutoModelForSeq2SeqLM.from_pretrained(
+                self.config.translation_model,
+                cache_dir=self.cache_dir
+            ).to(self.config.device).eval()
+            loaded = True
             logger.info("✅ Translation model loaded successfully")
             
         except Exception as e:
             logger.error(f"❌ Failed to load translation model: {e}")
-            initialization_results['translation'] = False
-            
-        # Load Sentiment Analysis Model
+            loaded = False
+
+        return loaded
+
+    def _load_sentiment_model(self) -> bool:
+        """Load the sentiment analysis tokenizer and model (blocking; run via asyncio.to_thread)"""
         try:
             logger.info("😊 Loading sentiment analysis model...")
-            from transformers import AutoTokenizer, AutoModelForSequenceClassification
-            
             self.models['sentiment_tokenizer'] = AutoTokenizer.from_pretrained(
                 self.config.sentiment_model,
                 cache_dir=self.cache_dir
             )
-            self.models['sentiment'] = AutoModelForSequenceClassification.from_pretrained(
-                self.config.sentiment_model,
-                cache_dir=self.cache_dir
-            ).to(self.config.device)
-            initialization_results['sentiment'] = True
+            self.models['sentiment'] = self._load_encoder(
+                AutoModelForSequenceClassification,
+                self.config.sentiment_model
+            )
+            loaded = True
             logger.info("✅ Sentiment analysis model loaded successfully")
             
         except Exception as e:
             logger.error(f"❌ Failed to load sentiment model: {e}")
-            initialization_results['sentiment'] = False
-            
-        # Load AI4Bharat Parler TTS Model (Human-like Speech)
+            loaded = False
+
+        return loaded
+
+    def _load_tts_model(self) -> bool:
+        """Load the Parler TTS model, walking the open-model fallback chain (blocking; run via asyncio.to_thread)"""
         try:
             logger.info("🔊 Loading AI4Bharat Parler TTS model...")
             from transformers import AutoTokenizer, AutoModel
@@ -472,7 +702,7 @@ class MalayalamModelManager:
                 self.config.tts_model,
                 cache_dir=self.cache_dir
             ).to(self.config.device)
-            initialization_results['tts'] = True
+            loaded = True
             logger.info("✅ AI4Bharat Parler TTS model loaded successfully")
 
         except Exception as e:
@@ -490,7 +720,7 @@ class MalayalamModelManager:
                     self.config.tts_model_lfm,
                     cache_dir=self.cache_dir
                 ).to(self.config.device)
-                initialization_results['tts'] = True
+                loaded = True
                 logger.info("✅ LFM Malayalam TTS loaded successfully (open alternative)")
             except Exception as lfm_e:
                 logger.error(f"❌ Failed to load LFM TTS: {lfm_e}")
@@ -505,7 +735,7 @@ class MalayalamModelManager:
                         self.config.tts_model_orpheus,
                         cache_dir=self.cache_dir
                     ).to(self.config.device)
-                    initialization_results['tts'] = True
+                    loaded = True
                     logger.info("✅ Orpheus Malayalam TTS loaded successfully (open alternative)")
                 except Exception as orpheus_e:
                     logger.error(f"❌ Failed to load Orpheus TTS: {orpheus_e}")
@@ -519,18 +749,14 @@ class MalayalamModelManager:
                         self.models['tts'] = SpeechT5ForTextToSpeech.from_pretrained(
                             "microsoft/speecht5_tts", cache_dir=self.cache_dir
                         ).to(self.config.device)
-                        initialization_results['tts'] = True
+                        loaded = True
                         logger.info("✅ Fallback TTS model loaded successfully")
                     except Exception as final_e:
                         logger.error(f"❌ Failed to load any TTS model: {final_e}")
-                        initialization_results['tts'] = False
-            
-        success_count = sum(initialization_results.values())
-        total_count = len(initialization_results)
-        
-        logger.info(f"🎉 Model initialization complete: {success_count}/{total_count} models loaded successfully")
-        return initialization_results
-        
+                        loaded = False
+
+        return loaded
+
     async def transcribe_malayalam_audio(self, audio_file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Transcribe Malayalam audio to text using cloud APIs first, then local models
@@ -566,40 +792,11 @@ class MalayalamModelManager:
         # Fall back to local models
         logger.info("🏠 Falling back to local models for Malayalam transcription...")
         
-        if 'stt' not in self.models or 'stt_processor' not in self.models:
+        if not await self._ensure_model('stt'):
             return {"error": "No STT models available (cloud APIs failed and local models not loaded)", "success": False}
             
         try:
-            # Load audio file
-            speech, sample_rate = sf.read(audio_file_path)
-            
-            # Ensure 16kHz sample rate (required by Wav2Vec2)
-            if sample_rate != 16000:
-                import librosa
-                speech = librosa.resample(speech, orig_sr=sample_rate, target_sr=16000)
-                
-            # Process audio with AI4Bharat processor
-            inputs = self.models['stt_processor'](
-                speech, 
-                sampling_rate=16000, 
-                return_tensors="pt", 
-                padding=True
-            ).to(self.config.device)
-            
-            # Generate transcription using sequence-to-sequence model
-            with torch.no_grad():
-                generated_tokens = self.models['stt'].generate(
-                    inputs.input_features,
-                    max_length=512,
-                    num_beams=4,
-                    do_sample=False,
-                    early_stopping=True
-                )
-                
-            # Decode the transcription
-            transcription = self.models['stt_processor'].batch_decode(
-                generated_tokens, skip_special_tokens=True
-            )[0]
+            transcription, audio_duration = await asyncio.to_thread(self._transcribe_local, audio_path)
             
             # For sequence models, confidence is estimated differently
             confidence = 0.85  # Default high confidence for AI4Bharat models
@@ -610,7 +807,7 @@ class MalayalamModelManager:
                 "language": "malayalam",
                 "model": "ai4bharat_indicconformer",
                 "success": True,
-                "audio_duration": len(speech) / 16000
+                "audio_duration": audio_duration
             }
             
             logger.info(f"📝 Local model transcribed Malayalam: '{transcription[:50]}...' (confidence: {confidence:.3f})")
@@ -620,6 +817,41 @@ class MalayalamModelManager:
             logger.error(f"❌ Local model Malayalam transcription failed: {e}")
             return {"error": str(e), "success": False}
             
+    def _transcribe_local(self, audio_path: Path) -> Tuple[str, float]:
+        """Read, resample and transcribe one audio file with the local STT model (blocking; run via asyncio.to_thread)"""
+        # Load audio file
+        speech, sample_rate = sf.read(audio_path)
+        
+        # Ensure 16kHz sample rate (required by Wav2Vec2)
+        if sample_rate != 16000:
+            import librosa
+            speech = librosa.resample(speech, orig_sr=sample_rate, target_sr=16000)
+            
+        # Process audio with AI4Bharat processor
+        inputs = self.models['stt_processor'](
+            speech, 
+            sampling_rate=16000, 
+            return_tensors="pt", 
+            padding=True
+        ).to(self.config.device)
+        
+        # Generate transcription using sequence-to-sequence model
+        with torch.no_grad():
+            generated_tokens = self.models['stt'].generate(
+                inputs.input_features,
+                max_length=512,
+                num_beams=4,
+                do_sample=False,
+                early_stopping=True
+            )
+            
+        # Decode the transcription
+        transcription = self.models['stt_processor'].batch_decode(
+            generated_tokens, skip_special_tokens=True
+        )[0]
+        
+        return transcription, len(speech) / 16000
+        
     async def understand_malayalam_intent(self, malayalam_text: str) -> Dict[str, Any]:
         """
         Analyze Malayalam text for intent and entities using IndicBERT
@@ -630,40 +862,18 @@ class MalayalamModelManager:
         Returns:
             Dict with intent analysis results
         """
-        if 'nlu' not in self.models:
+        if not await self._ensure_model('nlu'):
             return {"error": "NLU model not loaded", "success": False}
             
         try:
             # Basic intent analysis using masked language modeling
             # This is a simplified approach - in production, you'd fine-tune for specific intents
+            detected_intent, confidence = _match_intent(malayalam_text)
             
-            # Common IVR intent patterns in Malayalam
-            intent_patterns = {
-                "complaint": ["പരാതി", "പ്രശ്നം", "കുഴപ്പം", "തകരാർ"],
-                "inquiry": ["അന്വേഷണം", "വിവരം", "ചോദ്യം", "അറിയാൻ"],
-                "request": ["അപേക്ഷ", "ആവശ്യം", "വേണം", "കിട്ടുമോ"],
-                "greeting": ["ഹലോ", "നമസ്കാരം", "വന്ദനം"],
-                "goodbye": ["വിട", "പോകാം", "കാണാം"]
-            }
-            
-            # Simple keyword matching for intent classification
-            detected_intent = "unknown"
-            confidence = 0.0
-            
-            for intent, keywords in intent_patterns.items():
-                for keyword in keywords:
-                    if keyword in malayalam_text:
-                        detected_intent = intent
-                        confidence = 0.8  # Simple confidence score
-                        break
-                if detected_intent != "unknown":
-                    break
-                    
             # Use NLU model for more sophisticated analysis
             try:
-                # Mask a word to understand context
-                masked_text = malayalam_text.replace(malayalam_text.split()[0], "[MASK]", 1)
-                nlu_result = self.models['nlu'](masked_text)
+                # Inference runs on a worker thread so the event loop stays responsive
+                nlu_result = await asyncio.to_thread(self.models['nlu'], _mask_first_word(malayalam_text))
                 
                 result = {
                     "intent": detected_intent,
@@ -701,15 +911,15 @@ class MalayalamModelManager:
         Returns:
             Dict with translation results
         """
-        if 'translation' not in self.models:
+        if not await self._ensure_model('translation'):
             return {"error": "Translation model not loaded", "success": False}
             
         try:
-            translation_result = self.models['translation'](malayalam_text)
+            translations = await asyncio.to_thread(self._translate_texts, [malayalam_text])
             
             result = {
                 "original_text": malayalam_text,
-                "translated_text": translation_result[0]['translation_text'],
+                "translated_text": translations[0],
                 "source_language": "malayalam",
                 "target_language": "english",
                 "success": True
@@ -732,31 +942,18 @@ class MalayalamModelManager:
         Returns:
             Dict with sentiment analysis results
         """
-        if 'sentiment' not in self.models:
+        if not await self._ensure_model('sentiment'):
             return {"error": "Sentiment model not loaded", "success": False}
             
         try:
-            # Tokenize and process text
-            inputs = self.models['sentiment_tokenizer'](
-                text, 
-                return_tensors="pt", 
-                padding=True, 
-                truncation=True,
-                max_length=512
-            ).to(self.config.device)
+            predictions = await asyncio.to_thread(self._sentiment_probabilities, [text])
             
-            # Get sentiment prediction
-            with torch.no_grad():
-                outputs = self.models['sentiment'](**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                
             # Get the predicted class and confidence
-            predicted_class_id = int(predictions.argmax().item())
-            confidence = float(predictions.max().item())
+            predicted_class_id = int(predictions[0].argmax().item())
+            confidence = float(predictions[0].max().item())
             
             # Map class ID to sentiment label
-            id_to_label = {0: 'negative', 1: 'neutral', 2: 'positive'}
-            sentiment_label = id_to_label.get(predicted_class_id, 'neutral')
+            sentiment_label = SENTIMENT_LABELS.get(predicted_class_id, 'neutral')
             
             result = {
                 "text": text,
@@ -773,6 +970,166 @@ class MalayalamModelManager:
             logger.error(f"❌ Sentiment analysis failed: {e}")
             return {"error": str(e), "success": False}
             
+    def _translate_texts(self, texts: List[str]) -> List[str]:
+        """Translate texts in padded batches, one generate call per batch (blocking)"""
+        tokenizer = self.models['translation_tokenizer']
+        model = self.models['translation']
+        translations = []
+        
+        for start in range(0, len(texts), PIPELINE_BATCH_SIZE):
+            inputs = tokenizer(
+                texts[start:start + PIPELINE_BATCH_SIZE],
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=512
+            ).to(self.config.device)
+            
+            with torch.inference_mode():
+                outputs = model.generate(**inputs, num_beams=1, max_new_tokens=TRANSLATION_MAX_NEW_TOKENS)
+            translations.extend(tokenizer.batch_decode(outputs, skip_special_tokens=True))
+        
+        return translations
+
+    def _sentiment_probabilities(self, texts: List[str]) -> torch.Tensor:
+        """Class probabilities for a batch of texts from one padded forward pass (blocking)"""
+        # Tokenize and process text
+        inputs = self.models['sentiment_tokenizer'](
+            texts, 
+            return_tensors="pt", 
+            padding=True, 
+            truncation=True,
+            max_length=512
+        ).to(self.config.device)
+        
+        # Get sentiment prediction
+        with torch.no_grad():
+            outputs = self.models['sentiment'](**inputs)
+            return torch.nn.functional.softmax(outputs.logits, dim=-1)
+
+    async def analyze_batch(
+        self,
+        texts: List[str],
+        tasks: Sequence[str] = ("intent", "translation", "sentiment")
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run several analyses over a batch of texts with one batched call per model
+        
+        Args:
+            texts: Texts to analyze
+            tasks: Any of "intent", "translation" and "sentiment"
+            
+        Returns:
+            Dict mapping each task to per-text results, shaped like the single-text methods
+        """
+        runners = {
+            "intent": self._batch_intent,
+            "translation": self._batch_translate,
+            "sentiment": self._batch_sentiment
+        }
+        unknown_tasks = [task for task in tasks if task not in BATCH_TASK_MODELS]
+        if unknown_tasks:
+            raise ValueError(f"Unknown analysis tasks: {unknown_tasks}")
+        
+        # Models load on first use (a family that already failed is not retried here);
+        # then each model runs its batch on a worker thread, with the models running concurrently
+        await asyncio.gather(
+            *(self._ensure_model(model_name) for model_name in {BATCH_TASK_MODELS[task] for task in tasks})
+        )
+        batch_results = await asyncio.gather(
+            *(asyncio.to_thread(runners[task], list(texts)) for task in tasks),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for task, task_results in zip(tasks, batch_results):
+            if isinstance(task_results, Exception):
+                logger.error(f"❌ Batch {task} analysis failed: {task_results}")
+                task_results = [{"error": str(task_results), "success": False} for _ in texts]
+            results[task] = task_results
+        return results
+
+    def _batch_intent(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if 'nlu' not in self.models:
+            return [{"error": "NLU model not loaded", "success": False} for _ in texts]
+        
+        try:
+            nlu_results = self.models['nlu']([_mask_first_word(text) for text in texts])
+            # The pipeline unwraps single-item batches
+            if len(texts) == 1:
+                nlu_results = [nlu_results]
+        except Exception as nlu_error:
+            logger.warning(f"NLU model error: {nlu_error}, using basic intent detection")
+            nlu_results = None
+        
+        results = []
+        for i, text in enumerate(texts):
+            detected_intent, confidence = _match_intent(text)
+            result = {
+                "intent": detected_intent,
+                "confidence": confidence,
+                "text": text,
+                "language": "malayalam",
+                "success": True
+            }
+            if nlu_results is not None:
+                result["nlu_suggestions"] = nlu_results[i][:3] if nlu_results[i] else []
+            results.append(result)
+        return results
+
+    def _batch_translate(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if 'translation' not in self.models:
+            return [{"error": "Translation model not loaded", "success": False} for _ in texts]
+        
+        translations = self._translate_texts(texts)
+        return [
+            {
+                "original_text": text,
+                "translated_text": translation,
+                "source_language": "malayalam",
+                "target_language": "english",
+                "success": True
+            }
+            for text, translation in zip(texts, translations)
+        ]
+
+    def _batch_sentiment(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if 'sentiment' not in self.models:
+            return [{"error": "Sentiment model not loaded", "success": False} for _ in texts]
+        
+        predictions = self._sentiment_probabilities(texts)
+        confidences, class_ids = predictions.max(dim=-1)
+        return [
+            {
+                "text": text,
+                "sentiment": SENTIMENT_LABELS.get(int(class_id), 'neutral'),
+                "confidence": float(confidence),
+                "model": "transformer_sentiment",
+                "success": True
+            }
+            for text, confidence, class_id in zip(texts, confidences.tolist(), class_ids.tolist())
+        ]
+
+    def _synthesize_speech(self, malayalam_text: str, output_path: str) -> None:
+        """Generate speech with the Parler TTS model and write it to output_path (blocking; run via asyncio.to_thread)"""
+        inputs = self.models['tts_tokenizer'](
+            malayalam_text, 
+            return_tensors="pt"
+        ).to(self.config.device)
+        
+        with torch.no_grad():
+            # Generate speech with voice characteristics
+            voice_config = self.config.voice_config or {}
+            speech_output = self.models['tts'].generate(
+                **inputs,
+                # Apply voice configuration if available
+                # speaking_rate=voice_config.get("speaking_rate", 1.0),
+                # emotion_intensity=voice_config.get("emotion_intensity", 0.7)
+            )
+        
+        # Save generated audio
+        sf.write(output_path, speech_output.cpu().numpy(), 22050)  # Standard sample rate
+        
     async def generate_malayalam_speech(self, malayalam_text: str, output_path: str = "output_speech.wav") -> Dict[str, Any]:
         """
         Generate human-like Malayalam speech using AI4Bharat Parler TTS
@@ -784,7 +1141,7 @@ class MalayalamModelManager:
         Returns:
             Dict with generated audio information
         """
-        if 'tts' not in self.models:
+        if not await self._ensure_model('tts'):
             return {"error": "TTS model not loaded", "success": False}
             
         try:
@@ -793,24 +1150,7 @@ class MalayalamModelManager:
             # Check if we have AI4Bharat Parler TTS
             if 'tts_tokenizer' in self.models:
                 # Use AI4Bharat Parler TTS for human-like speech
-                inputs = self.models['tts_tokenizer'](
-                    malayalam_text, 
-                    return_tensors="pt"
-                ).to(self.config.device)
-                
-                with torch.no_grad():
-                    # Generate speech with voice characteristics
-                    voice_config = self.config.voice_config or {}
-                    speech_output = self.models['tts'].generate(
-                        **inputs,
-                        # Apply voice configuration if available
-                        # speaking_rate=voice_config.get("speaking_rate", 1.0),
-                        # emotion_intensity=voice_config.get("emotion_intensity", 0.7)
-                    )
-                
-                # Save generated audio
-                import soundfile as sf
-                sf.write(output_path, speech_output.cpu().numpy(), 22050)  # Standard sample rate
+                await asyncio.to_thread(self._synthesize_speech, malayalam_text, output_path)
                 
                 result = {
                     "text": malayalam_text,
@@ -918,6 +1258,48 @@ class MalayalamModelManager:
             'assemblyai': self.assemblyai_client and self.assemblyai_client.client is not None
         }
 
+# Initialized managers shared within the process, keyed by a hash of their ModelConfig
+_MANAGER_CACHE: Dict[str, MalayalamModelManager] = {}
+
+
+def _config_key(config: ModelConfig) -> str:
+    """Stable cache key for a ModelConfig (its field values, including post-init changes)"""
+    return hashlib.sha1(repr(dataclasses.asdict(config)).encode("utf-8")).hexdigest()
+
+
+async def get_or_create_manager(
+    config: Optional[ModelConfig] = None,
+    models: Optional[Sequence[str]] = None
+) -> MalayalamModelManager:
+    """
+    Return the shared MalayalamModelManager for this configuration with the requested models loaded
+    
+    Managers are reused for the lifetime of the process and a loaded model family is never
+    loaded again, so repeated calls are cheap; families that failed are retried. models=None runs the full initialize_models(); pass a
+    subset (e.g. ["nlu", "sentiment"]) to load only those now and the rest on first use.
+    Check manager.initialization_results for load status.
+    """
+    config = config or ModelConfig()
+    key = _config_key(config)
+    
+    manager = _MANAGER_CACHE.get(key)
+    if manager is None:
+        manager = _MANAGER_CACHE[key] = MalayalamModelManager(config)
+    else:
+        logger.info("♻️ Reusing cached Malayalam model manager")
+    
+    if models is None:
+        await manager.initialize_models()
+    else:
+        await manager.preload(models)
+    return manager
+
+
+async def preload_default() -> MalayalamModelManager:
+    """Warm the shared cache with the default model configuration"""
+    return await get_or_create_manager(ModelConfig())
+
+
 async def main():
     """Demo of Malayalam model integration"""
     logger.info("🚀 Starting Malayalam Pre-trained Models Demo")
@@ -213,6 +213,13 @@ class HuggingFaceDataIngester:
             engine_storage = self.raw_storage_path / engine_type
             engine_storage.mkdir(parents=True, exist_ok=True)
             
+            # Reuse a complete earlier download instead of fetching it again
+            if self.storage_config.get("reuse_existing", True):
+                existing_metadata = self._load_existing_dataset(dataset_name, engine_storage)
+                if existing_metadata is not None:
+                    logger.info(f"♻️ {dataset_name} already ingested - reusing local copy")
+                    return {dataset_name: existing_metadata}
+            
             # Load dataset from Hugging Face
             dataset = await self._download_hf_dataset(dataset_name)
             
@@ -232,6 +239,34 @@ class HuggingFaceDataIngester:
             logger.error(f"❌ Failed to ingest {dataset_name}: {str(e)}")
             raise e
 
+    def _load_existing_dataset(self, dataset_name: str, storage_path: Path) -> Optional[Dict]:
+        """
+        Return the saved metadata of a previously ingested dataset if all its splits are on disk.
+        
+        Args:
+            dataset_name: HF dataset identifier
+            storage_path: Engine-specific storage path
+            
+        Returns:
+            Optional[Dict]: Stored metadata, or None if the dataset must be downloaded
+        """
+        safe_name = dataset_name.replace("/", "_").replace("-", "_")
+        metadata_path = storage_path / safe_name / "metadata.json"
+        if not metadata_path.exists():
+            return None
+        
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        splits = metadata.get("splits", {})
+        if not splits or not all(Path(split["path"]).exists() for split in splits.values()):
+            return None
+        
+        return metadata
+
     async def _download_hf_dataset(self, dataset_name: str) -> DatasetDict:
         """
         Download dataset from Hugging Face with error handling and modern loading standards.
@@ -4,23 +4,31 @@ Data Foundry Phase 2: Standardization & Preprocessing
 Convert disparate dataset formats into unified standards for AI model training.
 """
 
+import io
 import os
+import sys
 import json
 import logging
 import asyncio
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import partial
 
 import pandas as pd
 import numpy as np
-import librosa
-import soundfile as sf
 from tqdm import tqdm
 import re
 import unicodedata
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +40,116 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Separator line used by the console summary
+_BANNER = "=" * 60
+
+# Audio conversion worker processes, and rows shipped to them per batch
+_AUDIO_WORKERS = 4
+_AUDIO_BATCH_ROWS = 256
+
+
+# Static tail of the standardization report; a constant tuple is folded at compile time
+_NEXT_PHASE_RECOMMENDATIONS = (
+    "Proceed to Phase 3: Strategic Allocation",
+    "Review quality metrics for datasets with low Malayalam coverage",
+    "Consider additional preprocessing for datasets with high error rates",
+    "Prepare engine-specific routing configurations"
+)
+
+
+def _json_default(obj):
+    """Serialize numpy scalars that leak into reports from pandas aggregations."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dump_json_bytes(payload: Dict) -> bytes:
+    """Serialize a report to indented UTF-8 JSON, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        # orjson emits UTF-8 directly, skipping the per-string ensure_ascii scan that
+        # makes stdlib json slow on Malayalam text; NON_STR_KEYS keeps parity with
+        # json for value_counts() dicts keyed by ints
+        return orjson.dumps(
+            payload,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _convert_audio_sync(
+    audio_data: Union[np.ndarray, bytes, str],
+    file_id: str,
+    target_format: Dict
+) -> Optional[Dict]:
+    """
+    Blocking audio conversion worker, executed in the preprocessor's process pool.
+    
+    Kept at module level so it can be pickled into worker processes.
+    """
+    # librosa pulls in numba/scipy/sklearn, so defer it until audio is converted
+    import librosa
+    
+    try:
+        # Handle different audio input formats
+        if isinstance(audio_data, bytes):
+            # Assume WAV bytes, use librosa to load
+            audio, original_sr = librosa.load(io.BytesIO(audio_data), sr=None)
+        elif isinstance(audio_data, str) and os.path.exists(audio_data):
+            # Audio file path
+            audio, original_sr = librosa.load(audio_data, sr=None)
+        elif isinstance(audio_data, np.ndarray):
+            # Already loaded audio array
+            audio = audio_data
+            original_sr = 22050  # Default assumption, should be provided in metadata
+        else:
+            logger.warning(f"⚠️ Unsupported audio format for {file_id}")
+            return None
+        
+        # Resample to target sample rate
+        if original_sr != target_format["sample_rate"]:
+            audio = librosa.resample(
+                audio, 
+                orig_sr=original_sr, 
+                target_sr=target_format["sample_rate"]
+            )
+        
+        # Convert to mono if stereo
+        if len(audio.shape) > 1:
+            audio = librosa.to_mono(audio)
+        
+        # Normalize audio levels
+        audio = audio / max(abs(audio.max()), abs(audio.min()))
+        audio = audio * 0.95  # Prevent clipping
+        
+        # Filter by duration
+        duration = len(audio) / target_format["sample_rate"]
+        if (duration < target_format["min_duration"] or 
+            duration > target_format["max_duration"]):
+            
+            if duration > target_format["max_duration"]:
+                # Chunk long audio into segments
+                max_samples = int(target_format["max_duration"] * target_format["sample_rate"])
+                audio = audio[:max_samples]
+                duration = target_format["max_duration"]
+            else:
+                logger.warning(f"⚠️ Audio too short ({duration:.2f}s) for {file_id}")
+                return None
+        
+        return {
+            "data": audio,
+            "sample_rate": target_format["sample_rate"],
+            "duration": duration,
+            "channels": 1,
+            "format": "wav"
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Audio conversion failed for {file_id}: {str(e)}")
+        return None
+
+
 class DataFoundryPreprocessor:
     """
     Phase 2: Standardization & Preprocessing Pipeline
@@ -75,6 +193,10 @@ class DataFoundryPreprocessor:
         self.raw_path = Path(raw_data_path)
         self.silver_path = Path(silver_storage_path)
         self.silver_path.mkdir(parents=True, exist_ok=True)
+        self._silver_str = os.fspath(self.silver_path)
+        
+        # Single timestamp shared by every artifact written during this run
+        self._run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Initialize processing statistics
         self.stats = {
@@ -92,7 +214,7 @@ class DataFoundryPreprocessor:
         )
         
         # Initialize processing pools
-        self.process_pool = ProcessPoolExecutor(max_workers=4)
+        self.process_pool = ProcessPoolExecutor(max_workers=_AUDIO_WORKERS)
         self.thread_pool = ThreadPoolExecutor(max_workers=8)
 
     async def standardize_all_datasets(self) -> Dict:
@@ -213,6 +335,9 @@ class DataFoundryPreprocessor:
         """
         logger.info("🎵 Processing audio dataset...")
         
+        # Imported lazily: only audio datasets need the audio stack
+        import soundfile as sf
+        
         result = {
             "type": "audio_standardization",
             "input_files": 0,
@@ -236,19 +361,36 @@ class DataFoundryPreprocessor:
             audio_output_dir = output_path / "audio" / split_name
             audio_output_dir.mkdir(parents=True, exist_ok=True)
             
-            for idx, row in tqdm(df.iterrows(), total=len(df), desc=f"Processing {split_name}"):
+            def record_error(idx, error: Exception):
+                error_msg = f"Row {idx}: {str(error)}"
+                result["conversion_errors"].append(error_msg)
+                logger.warning(f"⚠️ Audio conversion error: {error_msg}")
+                self.stats["audio_conversions"]["failed"] += 1
+            
+            progress = tqdm(total=len(df), desc=f"Processing {split_name}")
+            for start in range(0, len(df), _AUDIO_BATCH_ROWS):
+                # Extract audio data and text for the whole batch first
+                pending = []
+                for idx, row in df.iloc[start:start + _AUDIO_BATCH_ROWS].iterrows():
+                    try:
+                        audio_data = self._extract_audio_from_row(row)
+                        if audio_data is not None:
+                            pending.append((idx, audio_data, self._extract_text_from_row(row)))
+                    except Exception as e:
+                        record_error(idx, e)
+                
+                # Standardize audio format for the batch on the process pool
                 try:
-                    # Extract audio data and text
-                    audio_data = self._extract_audio_from_row(row)
-                    text_data = self._extract_text_from_row(row)
-                    
-                    if audio_data is not None:
-                        # Standardize audio format
-                        standardized_audio = await self._convert_audio_to_standard_format(
-                            audio_data, 
-                            f"{split_name}_{idx:06d}"
-                        )
-                        
+                    converted = await self._convert_audio_batch(
+                        [(audio_data, f"{split_name}_{idx:06d}") for idx, audio_data, _ in pending]
+                    )
+                except Exception as e:
+                    for idx, _, _ in pending:
+                        record_error(idx, e)
+                    converted = []
+                
+                for (idx, _, text_data), standardized_audio in zip(pending, converted):
+                    try:
                         if standardized_audio:
                             # Save standardized audio
                             audio_filename = f"{split_name}_{idx:06d}.wav"
@@ -280,12 +422,12 @@ class DataFoundryPreprocessor:
                             self.stats["audio_conversions"]["successful"] += 1
                         else:
                             self.stats["audio_conversions"]["failed"] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Row {idx}: {str(e)}"
-                    result["conversion_errors"].append(error_msg)
-                    logger.warning(f"⚠️ Audio conversion error: {error_msg}")
-                    self.stats["audio_conversions"]["failed"] += 1
+                        
+                    except Exception as e:
+                        record_error(idx, e)
+                
+                progress.update(min(_AUDIO_BATCH_ROWS, len(df) - start))
+            progress.close()
             
             # Save processed dataset split
             if processed_rows:
@@ -301,78 +443,31 @@ class DataFoundryPreprocessor:
         
         return result
 
-    async def _convert_audio_to_standard_format(
+    async def _convert_audio_batch(
         self, 
-        audio_data: Union[np.ndarray, bytes, str], 
-        file_id: str
-    ) -> Optional[Dict]:
+        audio_items: List[Tuple[Union[np.ndarray, bytes, str], str]]
+    ) -> List[Optional[Dict]]:
         """
-        Convert audio to standard 16kHz mono WAV format.
+        Convert a batch of audio clips to standard 16kHz mono WAV format.
         
         Args:
-            audio_data: Raw audio data in various formats
-            file_id: Unique identifier for logging
+            audio_items: (raw audio data, unique identifier for logging) pairs
             
         Returns:
-            Dict: Standardized audio data and metadata
+            List: Standardized audio data and metadata per item (None if it failed), in order
         """
-        try:
-            # Handle different audio input formats
-            if isinstance(audio_data, bytes):
-                # Assume WAV bytes, use librosa to load
-                audio, original_sr = librosa.load(io.BytesIO(audio_data), sr=None)
-            elif isinstance(audio_data, str) and os.path.exists(audio_data):
-                # Audio file path
-                audio, original_sr = librosa.load(audio_data, sr=None)
-            elif isinstance(audio_data, np.ndarray):
-                # Already loaded audio array
-                audio = audio_data
-                original_sr = 22050  # Default assumption, should be provided in metadata
-            else:
-                logger.warning(f"⚠️ Unsupported audio format for {file_id}")
-                return None
-            
-            # Resample to target sample rate
-            if original_sr != self.AUDIO_TARGET_FORMAT["sample_rate"]:
-                audio = librosa.resample(
-                    audio, 
-                    orig_sr=original_sr, 
-                    target_sr=self.AUDIO_TARGET_FORMAT["sample_rate"]
-                )
-            
-            # Convert to mono if stereo
-            if len(audio.shape) > 1:
-                audio = librosa.to_mono(audio)
-            
-            # Normalize audio levels
-            audio = audio / max(abs(audio.max()), abs(audio.min()))
-            audio = audio * 0.95  # Prevent clipping
-            
-            # Filter by duration
-            duration = len(audio) / self.AUDIO_TARGET_FORMAT["sample_rate"]
-            if (duration < self.AUDIO_TARGET_FORMAT["min_duration"] or 
-                duration > self.AUDIO_TARGET_FORMAT["max_duration"]):
-                
-                if duration > self.AUDIO_TARGET_FORMAT["max_duration"]:
-                    # Chunk long audio into segments
-                    max_samples = int(self.AUDIO_TARGET_FORMAT["max_duration"] * self.AUDIO_TARGET_FORMAT["sample_rate"])
-                    audio = audio[:max_samples]
-                    duration = self.AUDIO_TARGET_FORMAT["max_duration"]
-                else:
-                    logger.warning(f"⚠️ Audio too short ({duration:.2f}s) for {file_id}")
-                    return None
-            
-            return {
-                "data": audio,
-                "sample_rate": self.AUDIO_TARGET_FORMAT["sample_rate"],
-                "duration": duration,
-                "channels": 1,
-                "format": "wav"
-            }
-            
-        except Exception as e:
-            logger.error(f"❌ Audio conversion failed for {file_id}: {str(e)}")
-            return None
+        if not audio_items:
+            return []
+        
+        audio_data, file_ids = zip(*audio_items)
+        convert = partial(_convert_audio_sync, target_format=self.AUDIO_TARGET_FORMAT)
+        # Decode/resample is CPU-bound: hand the batch to the process pool in chunks so all
+        # workers stay busy and pickling/IPC is paid per chunk rather than per row.
+        # Executor.map blocks while collecting results, so drive it from a thread.
+        chunksize = max(1, len(audio_items) // (_AUDIO_WORKERS * 4))
+        return await asyncio.to_thread(
+            lambda: list(self.process_pool.map(convert, audio_data, file_ids, chunksize=chunksize))
+        )
 
     async def _standardize_sentiment_dataset(
         self, 
@@ -728,54 +823,70 @@ class DataFoundryPreprocessor:
         }
         
         metadata_path = output_path / "standardization_metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(self._write_json_sync, metadata_path, metadata)
 
     def _generate_standardization_report(self) -> Dict:
         """Generate comprehensive standardization report."""
+        audio = self.stats["audio_conversions"]
+        audio_ok, audio_failed = audio["successful"], audio["failed"]
+        audio_rate = (audio_ok / max(audio_ok + audio_failed, 1)) * 100
+        
+        text = self.stats["text_normalizations"]
+        text_ok, text_failed = text["successful"], text["failed"]
+        text_rate = (text_ok / max(text_ok + text_failed, 1)) * 100
+        
         return {
             "session_metadata": self.stats,
             "processing_summary": {
                 "total_datasets_processed": len(self.stats["processed_datasets"]),
-                "audio_conversion_rate": (
-                    self.stats["audio_conversions"]["successful"] / 
-                    max(self.stats["audio_conversions"]["successful"] + self.stats["audio_conversions"]["failed"], 1)
-                ) * 100,
-                "text_normalization_rate": (
-                    self.stats["text_normalizations"]["successful"] /
-                    max(self.stats["text_normalizations"]["successful"] + self.stats["text_normalizations"]["failed"], 1)
-                ) * 100
+                "audio_conversion_rate": audio_rate,
+                "text_normalization_rate": text_rate
             },
-            "next_phase_recommendations": [
-                "Proceed to Phase 3: Strategic Allocation",
-                "Review quality metrics for datasets with low Malayalam coverage",
-                "Consider additional preprocessing for datasets with high error rates",
-                "Prepare engine-specific routing configurations"
-            ]
+            "next_phase_recommendations": _NEXT_PHASE_RECOMMENDATIONS
         }
 
     async def _save_processing_metadata(self, report: Dict):
         """Save processing metadata and report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._run_timestamp
         
-        report_path = self.silver_path / f"standardization_report_{timestamp}.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        report_path = os.path.join(self._silver_str, f"standardization_report_{timestamp}.json")
+        await asyncio.to_thread(self._write_json_sync, report_path, report)
+
+    @staticmethod
+    def _write_json_sync(path: Union[str, Path], payload: Dict):
+        """Blocking JSON writer; always invoked off the event loop via asyncio.to_thread."""
+        data = _dump_json_bytes(payload)
+        # Write to a sibling temp file and rename over the target so later phases
+        # never observe a truncated report if the process dies mid-write
+        tmp_path = f"{os.fspath(path)}.tmp"
+        # Size the buffer to the payload so the report lands in a single write()
+        with open(tmp_path, 'wb', buffering=max(len(data), 1)) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
     def _print_processing_summary(self, report: Dict):
         """Print human-readable processing summary."""
-        print("\n" + "="*60)
-        print("🔧 DATA FOUNDRY PHASE 2 COMPLETE")
-        print("="*60)
-        
         summary = report["processing_summary"]
-        print(f"📊 Datasets Processed: {summary['total_datasets_processed']}")
-        print(f"🎵 Audio Conversion Rate: {summary['audio_conversion_rate']:.1f}%")
-        print(f"📝 Text Normalization Rate: {summary['text_normalization_rate']:.1f}%")
-        
-        print(f"\n📁 Standardized data stored in: {self.silver_path}")
-        print("🔄 Ready for Phase 3: Strategic Allocation")
-        print("="*60)
+        datasets, audio_rate, text_rate = (
+            summary['total_datasets_processed'],
+            summary['audio_conversion_rate'],
+            summary['text_normalization_rate']
+        )
+        lines = [
+            f"\n{_BANNER}\n🔧 DATA FOUNDRY PHASE 2 COMPLETE\n{_BANNER}",
+            f"📊 Datasets Processed: {datasets}",
+            "🎵 Audio Conversion Rate: %.1f%%" % audio_rate,
+            "📝 Text Normalization Rate: %.1f%%" % text_rate,
+            f"\n📁 Standardized data stored in: {self.silver_path}",
+            "🔄 Ready for Phase 3: Strategic Allocation",
+            _BANNER,
+        ]
+        
+        # Emit the whole summary in one write instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 async def main():
@@ -796,18 +907,24 @@ async def main():
     except Exception as e:
         logger.error(f"💥 Data Foundry Phase 2 failed: {str(e)}")
         raise e
+    
+    finally:
+        preprocessor.process_pool.shutdown()
+        preprocessor.thread_pool.shutdown()
 
 
 if __name__ == "__main__":
-    # Ensure required dependencies are installed
-    try:
-        import librosa
-        import soundfile
-        import pandas as pd
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("📦 Install with: pip install librosa soundfile pandas")
-        exit(1)
+    # Ensure required dependencies are installed without paying their import cost
+    for dependency in ("librosa", "soundfile", "pandas"):
+        if importlib.util.find_spec(dependency) is None:
+            print(f"❌ Missing dependency: {dependency}")
+            print("📦 Install with: pip install librosa soundfile pandas")
+            exit(1)
     
-    # Run the preprocessing pipeline
-    asyncio.run(main())
\ No newline at end of file
+    # Run the preprocessing pipeline, on uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
@@ -5,18 +5,45 @@ Route standardized datasets to specific AI engines with optimal mapping strategi
 """
 
 import os
+import sys
 import json
 import logging
 import asyncio
+import re
+import unicodedata
+from collections import Counter, namedtuple
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from tqdm import tqdm
 
+# Copy-on-Write lets optimizers filter/assign without eagerly duplicating every
+# column; it is always on from pandas 3, where setting the option is deprecated
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +65,468 @@ class AIEngine(Enum):
     TRANSLATION_MODEL = "translation_model"
     MALAYALAM_TTS = "malayalam_tts"
 
+_BANNER = "=" * 60
+
+# Every engine's string value, in declaration order
+ALL_ENGINE_VALUES: Tuple[str, ...] = tuple(engine.value for engine in AIEngine)
+
+# Engines whose optimizers balance classes and therefore need a whole split at once;
+# every other engine's optimizer is row-local and is streamed batch by batch
+WHOLE_SPLIT_ENGINES = frozenset((AIEngine.DIALECT_ADAPTER, AIEngine.SENTIMENT_CLASSIFIER))
+STREAM_BATCH_SIZE = 64_000
+PARQUET_WRITE_OPTIONS = {"compression": "zstd", "compression_level": 3, "use_dictionary": True}
+
+# Consolidated NDJSON log of every training config written during a run (under gold/)
+TRAINING_CONFIGS_LOG = "training_configs.ndjson"
+
+# Per-engine training parameters and evaluation metrics, shared read-only by every
+# generated training configuration
+ENGINE_TRAINING_PARAMS: Mapping[AIEngine, Mapping[str, Any]] = MappingProxyType({
+    AIEngine.WHISPER_STT: MappingProxyType({
+        "epochs": 10,
+        "learning_rate": 1e-5,
+        "batch_size": 16,
+        "weight_decay": 0.01,
+        "warmup_steps": 500
+    }),
+    AIEngine.DIALECT_ADAPTER: MappingProxyType({
+        "epochs": 20,
+        "learning_rate": 1e-4,
+        "lora_rank": 16,
+        "lora_alpha": 32,
+        "target_modules": ("q_proj", "v_proj")
+    }),
+    AIEngine.SENTIMENT_CLASSIFIER: MappingProxyType({
+        "epochs": 15,
+        "learning_rate": 2e-5,
+        "batch_size": 32,
+        "class_weights": "balanced"
+    })
+})
+DEFAULT_TRAINING_PARAMS: Mapping[str, Any] = MappingProxyType({"epochs": 10, "learning_rate": 1e-5})
+
+ENGINE_EVALUATION_METRICS: Mapping[AIEngine, Tuple[str, ...]] = MappingProxyType({
+    AIEngine.WHISPER_STT: ("wer", "cer", "bleu"),
+    AIEngine.DIALECT_ADAPTER: ("dialect_accuracy", "wer_by_dialect"),
+    AIEngine.SENTIMENT_CLASSIFIER: ("accuracy", "f1_macro", "confusion_matrix"),
+    AIEngine.NLU_INTENT: ("intent_accuracy", "f1_weighted"),
+    AIEngine.TRANSLATION_MODEL: ("bleu", "meteor", "rouge"),
+    AIEngine.MALAYALAM_TTS: ("mel_cepstral_distortion", "naturalness_score")
+})
+DEFAULT_EVALUATION_METRICS: Tuple[str, ...] = ("accuracy", "loss")
+
+# Label column each engine's validation folds are stratified on; engines without
+# one get folds balanced by size only
+VALIDATION_LABEL_COLUMNS: Mapping[AIEngine, str] = MappingProxyType({
+    AIEngine.DIALECT_ADAPTER: "dialect",
+    AIEngine.NLU_INTENT: "ivr_intent",
+    AIEngine.NLU_UNDERSTANDING: "semantic_category",
+    AIEngine.SENTIMENT_CLASSIFIER: "sentiment"
+})
+CROSS_VALIDATION_FOLDS = 5
+
+# Immutable, pre-extracted view of one ALLOCATION_STRATEGY entry
+StrategyTuple = namedtuple(
+    "StrategyTuple",
+    "target_engine priority allocation_ratio training_strategy special_handling value_proposition"
+)
+
+
+def _normalize_dataset_name(name: str) -> str:
+    """Normalize a Hugging Face dataset id the way strategy keys and Phase 2 directories are named."""
+    return name.replace("/", "_").replace("-", "_")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, preferring orjson's C decoder when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj):
+    """Serialize read-only config mappings and numpy scalars from pandas aggregations."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(payload) -> bytes:
+    """Serialize to UTF-8 JSON bytes, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_dumps_indented(payload) -> bytes:
+    """Serialize a report or config to indented UTF-8 JSON, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            payload,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _init_pool_worker():
+    """Process-pool worker initializer: cap Arrow's compute thread pool at one thread."""
+    pa.set_cpu_count(1)
+
+
+def _append_bytes(path: Path, data: bytes):
+    """Blocking append of one pre-serialized record, used from worker threads."""
+    with open(path, 'ab') as f:
+        f.write(data)
+
+
+def _read_json_file(path: str):
+    """Blocking JSON file reader, used from worker threads."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _scan_metadata_files(silver_path: Path) -> Dict[str, Tuple[str, int]]:
+    """
+    Map each silver engine/dataset directory to its metadata file and mtime.
+    
+    Blocking directory walk, used from a worker thread.
+    """
+    # scandir reports entry types without an extra stat per entry
+    metadata_files = {}
+    with os.scandir(silver_path) as engine_entries:
+        for engine_entry in engine_entries:
+            if not engine_entry.is_dir():
+                continue
+            with os.scandir(engine_entry.path) as dataset_entries:
+                for dataset_entry in dataset_entries:
+                    if not dataset_entry.is_dir():
+                        continue
+                    metadata_file = os.path.join(dataset_entry.path, "standardization_metadata.json")
+                    try:
+                        mtime_ns = os.stat(metadata_file).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+                    metadata_files[dataset_entry.path] = (metadata_file, mtime_ns)
+    return metadata_files
+
+
+class _AsyncJsonWriter:
+    """
+    Queue of JSON artifacts written together off the event loop.
+    
+    Payloads are serialized when queued; flush() writes every pending file
+    concurrently in worker threads, so the event loop never blocks on disk I/O.
+    """
+    
+    def __init__(self):
+        self._pending: List[Tuple[Path, bytes]] = []
+    
+    def queue(self, path: Path, payload):
+        """Serialize a payload and schedule it for the next flush."""
+        self._pending.append((path, _json_dumps_indented(payload)))
+    
+    async def flush(self):
+        """Write all queued artifacts and clear the queue."""
+        pending, self._pending = self._pending, []
+        await asyncio.gather(*[
+            asyncio.to_thread(path.write_bytes, data) for path, data in pending
+        ])
+
+
+def _compile_markers(markers: frozenset, flags: int = 0) -> "re.Pattern":
+    """Compile a marker set into one regex alternation (longest markers first)."""
+    return re.compile("|".join(sorted(map(re.escape, markers), key=len, reverse=True)), flags)
+
+
+# Linguistic marker sets used by the Phase 3 classifiers, compiled once at import.
+# Malayalam has no letter case, so only the mixed English keywords need IGNORECASE.
+TRAVANCORE_MARKERS = frozenset(("അവിടെ", "ഇവിടെ", "കേട്ടോ"))
+MALABAR_MARKERS = frozenset(("അവിടെക്ക്", "ഇവിടെക്ക്", "കേൾക്കുന്നുണ്ടോ"))
+COCHIN_MARKERS = frozenset(("അവിടുത്തേക്ക്", "ഇവിടുത്തേക്ക്", "കേട്ടുണ്ടോ"))
+
+RELIGIOUS_MARKERS = frozenset(("ദൈവം", "ഭഗവാൻ", "അള്ളാഹ്", "പ്രാർത്ഥന"))
+FESTIVAL_MARKERS = frozenset(("ഓണം", "വിഷു", "ക്രിസ്മസ്", "ഈദ്"))
+FAMILY_MARKERS = frozenset(("അച്ഛൻ", "അമ്മ", "കുട്ടി", "മുത്തശ്ശി"))
+
+HELP_KEYWORDS = frozenset(("സഹായം", "help", "assistance"))
+BILLING_KEYWORDS = frozenset(("ബില്ലിംഗ്", "payment", "bill"))
+TRANSFER_KEYWORDS = frozenset(("ട്രാൻസ്ഫർ", "transfer", "agent"))
+APPOINTMENT_KEYWORDS = frozenset(("അപ്പോയിന്റ്മെന്റ്", "appointment"))
+
+QUESTION_MARKERS = frozenset(("?", "എന്ത്"))
+POLITE_MARKERS = frozenset(("ദയവായി", "please", "കഴിയുമോ"))
+CONFIRMATION_MARKERS = frozenset(("അതെ", "ഇല്ല", "yes", "no"))
+
+SEMANTIC_QUESTION_MARKERS = frozenset(("എന്താണ്", "എങ്ങനെ", "എവിടെ"))
+SEMANTIC_REQUEST_MARKERS = frozenset(("കഴിയും", "വേണം", "ആവശ്യം"))
+
+CULTURAL_TOKENS = RELIGIOUS_MARKERS | FESTIVAL_MARKERS | FAMILY_MARKERS
+
+# Shared vocabulary tokenization; bump the version whenever tokenization changes
+SHARED_VOCAB_SIZE = 10000
+TOKENIZER_VERSION = 1
+_TOKEN_PATTERN = re.compile(r"[^\s.,!?;:\"'()\[\]{}।॥]+")
+
+
+@lru_cache(maxsize=1 << 20)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """
+    Split text into normalized word tokens.
+    
+    Memoized because the text engines are fed from overlapping Malayalam corpora,
+    so the same utterance is tokenized once per process rather than once per engine.
+    """
+    return tuple(_TOKEN_PATTERN.findall(unicodedata.normalize("NFC", text).lower()))
+
+
+# (pattern, label) rules in priority order for each classifier
+DIALECT_MARKER_SETS = (
+    (TRAVANCORE_MARKERS, "travancore"),
+    (MALABAR_MARKERS, "malabar"),
+    (COCHIN_MARKERS, "cochin")
+)
+DIALECT_RULES = tuple((_compile_markers(markers), label) for markers, label in DIALECT_MARKER_SETS)
+CULTURAL_CONTEXT_RULES = (
+    (_compile_markers(RELIGIOUS_MARKERS), "religious"),
+    (_compile_markers(FESTIVAL_MARKERS), "festival"),
+    (_compile_markers(FAMILY_MARKERS), "family")
+)
+IVR_INTENT_RULES = (
+    (_compile_markers(HELP_KEYWORDS, re.IGNORECASE), "request_help"),
+    (_compile_markers(BILLING_KEYWORDS, re.IGNORECASE), "billing_inquiry"),
+    (_compile_markers(TRANSFER_KEYWORDS, re.IGNORECASE), "request_transfer"),
+    (_compile_markers(APPOINTMENT_KEYWORDS, re.IGNORECASE), "schedule_appointment")
+)
+CONVERSATION_CONTEXT_RULES = (
+    (_compile_markers(QUESTION_MARKERS), "question"),
+    (_compile_markers(POLITE_MARKERS), "polite_request"),
+    (_compile_markers(CONFIRMATION_MARKERS), "confirmation")
+)
+SEMANTIC_CATEGORY_RULES = (
+    (_compile_markers(SEMANTIC_QUESTION_MARKERS), "question"),
+    (_compile_markers(SEMANTIC_REQUEST_MARKERS), "request")
+)
+
+
+# Codepoint lookup table for the Malayalam Unicode block (U+0D00-U+0D7F)
+MALAYALAM_BLOCK_START = 0x0D00
+IS_MALAYALAM = np.zeros(0x110000, dtype=bool)
+IS_MALAYALAM[MALAYALAM_BLOCK_START:MALAYALAM_BLOCK_START + 0x80] = True
+
+
+def _flatten_codepoints(texts: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pack a text column into one UTF-32 codepoint buffer with per-row offsets and lengths."""
+    values = texts.fillna("").tolist()
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    codepoints = np.frombuffer("".join(values).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    return codepoints, offsets, lengths
+
+
+def _pack_marker_sets(marker_sets) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Encode (markers, label) rules as needle codepoints, needle offsets and rule indices."""
+    needles = [
+        (rule, marker)
+        for rule, (markers, _) in enumerate(marker_sets)
+        for marker in sorted(markers)
+    ]
+    lengths = np.array([len(marker) for _, marker in needles], dtype=np.int64)
+    needle_offsets = np.zeros(len(needles) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=needle_offsets[1:])
+    needle_codepoints = np.frombuffer(
+        "".join(marker for _, marker in needles).encode("utf-32-le"), dtype=np.uint32
+    )
+    needle_rules = np.array([rule for rule, _ in needles], dtype=np.int8)
+    return needle_codepoints, needle_offsets, needle_rules
+
+
+DIALECT_NEEDLES = _pack_marker_sets(DIALECT_MARKER_SETS)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _first_marker_rule(codepoints, offsets, needles, needle_offsets, needle_rules, default):
+        """Per-row index of the first rule with a marker present in the row, else default."""
+        n_rows = offsets.shape[0] - 1
+        n_needles = needle_offsets.shape[0] - 1
+        codes = np.empty(n_rows, dtype=np.int8)
+        for row in range(n_rows):
+            start = offsets[row]
+            end = offsets[row + 1]
+            best = default
+            for k in range(n_needles):
+                rule = needle_rules[k]
+                if rule >= best:
+                    continue
+                needle_start = needle_offsets[k]
+                needle_length = needle_offsets[k + 1] - needle_start
+                for i in range(start, end - needle_length + 1):
+                    if codepoints[i] != needles[needle_start]:
+                        continue
+                    j = 1
+                    while j < needle_length and codepoints[i + j] == needles[needle_start + j]:
+                        j += 1
+                    if j == needle_length:
+                        best = rule
+                        break
+            codes[row] = best
+        return codes
+
+    @njit(cache=True)
+    def _malayalam_bitmasks(codepoints, offsets):
+        """Per-row 128-bit masks (two uint64 words) of the Malayalam codepoints present."""
+        n_rows = offsets.shape[0] - 1
+        masks = np.zeros((n_rows, 2), dtype=np.uint64)
+        for row in range(n_rows):
+            low = np.uint64(0)
+            high = np.uint64(0)
+            for i in range(offsets[row], offsets[row + 1]):
+                bit = np.int64(codepoints[i]) - MALAYALAM_BLOCK_START
+                if 0 <= bit < 64:
+                    low |= np.uint64(1) << np.uint64(bit)
+                elif 64 <= bit < 128:
+                    high |= np.uint64(1) << np.uint64(bit - 64)
+            masks[row, 0] = low
+            masks[row, 1] = high
+        return masks
+
+
+def _count_unique_malayalam(codepoints: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Number of distinct Malayalam codepoints in each row of a flattened text column."""
+    n_rows = len(offsets) - 1
+    if NUMBA_AVAILABLE:
+        masks = _malayalam_bitmasks(codepoints, offsets)
+        return np.unpackbits(masks.view(np.uint8), axis=1).sum(axis=1)
+    
+    # Without numba: de-duplicate (row, codepoint) pairs and count them per row
+    rows = np.repeat(np.arange(n_rows, dtype=np.int64), np.diff(offsets))
+    in_block = IS_MALAYALAM[codepoints]
+    pairs = rows[in_block] * 128 + (codepoints[in_block].astype(np.int64) - MALAYALAM_BLOCK_START)
+    return np.bincount(np.unique(pairs) // 128, minlength=n_rows)
+
+
+def _generate_balanced_folds(
+    labels: np.ndarray,
+    k: int = CROSS_VALIDATION_FOLDS,
+    seed: int = 42,
+    max_swaps: int = 100_000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign samples to k folds so every class is spread evenly across folds.
+    
+    Starts from a random size-balanced partition and greedily swaps one sample of
+    the worst-balanced class from its most overfull fold to its most underfull
+    fold against one sample of a partner class going the other way, so fold sizes
+    never change. The (k, num_classes) count matrix is updated in place and only
+    the two affected classes' losses are recomputed; a swap is kept only if the
+    global loss drops. Concrete samples are drawn per class at the end.
+    
+    Args:
+        labels: Non-negative integer class code per sample
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Fold id per sample and the fold-by-class counts
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = labels.size
+    num_classes = int(labels.max()) + 1 if n_samples else 0
+    
+    # Random, size-balanced initial partition
+    initial = np.empty(n_samples, dtype=np.int64)
+    initial[rng.permutation(n_samples)] = np.arange(n_samples) % k
+    counts = np.zeros((k, num_classes), dtype=np.int64)
+    np.add.at(counts, (initial, labels), 1)
+    
+    # Squared deviation from the ideal per-fold class count, relative to class size
+    targets = np.bincount(labels, minlength=num_classes) / k
+    scale = np.maximum(targets, 1.0)
+    class_loss = ((counts - targets) ** 2).sum(axis=0) / scale
+    blocked = np.zeros(num_classes, dtype=bool)
+    
+    for _ in range(max_swaps):
+        candidates = np.where(blocked, -np.inf, class_loss)
+        if num_classes < 2 or not np.isfinite(candidates).any():
+            break
+        worst = int(np.argmax(candidates))
+        deviation = counts[:, worst] - targets[worst]
+        source, sink = int(np.argmax(deviation)), int(np.argmin(deviation))
+        
+        # Moving one sample changes a class's loss by 2 * (1 - gap) / scale, where gap is
+        # how far the giving fold is above the receiving fold for that class
+        worst_delta = 2.0 * (1.0 - (deviation[source] - deviation[sink])) / scale[worst]
+        partner_gap = counts[sink] - counts[source]
+        partner_delta = 2.0 * (1.0 - partner_gap) / scale
+        partner_delta[worst] = np.inf
+        partner_delta[counts[sink] == 0] = np.inf
+        partner = int(np.argmin(partner_delta))
+        
+        if source == sink or worst_delta + partner_delta[partner] >= 0:
+            blocked[worst] = True
+            continue
+        
+        counts[source, worst] -= 1
+        counts[sink, worst] += 1
+        counts[sink, partner] -= 1
+        counts[source, partner] += 1
+        for changed in (worst, partner):
+            class_loss[changed] = ((counts[:, changed] - targets[changed]) ** 2).sum() / scale[changed]
+        blocked[:] = False
+    
+    # Realize the count matrix: shuffle samples within each class and deal them
+    # out to folds in the per-class quantities the balancer settled on
+    order = np.lexsort((rng.random(n_samples), labels))
+    folds = np.empty(n_samples, dtype=np.int8)
+    folds[order] = np.repeat(np.tile(np.arange(k, dtype=np.int8), num_classes), counts.T.ravel())
+    return folds, counts
+
+
+# Temporary column used to re-attach audio payloads after pandas-side optimization
+_ROW_ID_COLUMN = "__allocation_row_id"
+
+
+def _is_audio_payload(data_type: pa.DataType) -> bool:
+    """Whether a column holds raw audio (encoded bytes, sample arrays or HF audio structs)."""
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type):
+        return True
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+        value_type = data_type.value_type
+        return pa.types.is_floating(value_type) or pa.types.is_integer(value_type)
+    if pa.types.is_struct(data_type):
+        return data_type.get_field_index("array") >= 0 or data_type.get_field_index("bytes") >= 0
+    return False
+
+
+def _select_first_match(
+    texts: pd.Series,
+    rules: Tuple[Tuple["re.Pattern", str], ...],
+    default: str
+) -> pd.Series:
+    """
+    Label each text with the first rule whose pattern it matches.
+    
+    Each rule is a precompiled marker alternation, so a whole column is scanned
+    per rule in pandas' regex engine instead of one Python call per row. Labels
+    come from a closed vocabulary, so the result is categorical: one small
+    integer code per row instead of a Python string.
+    """
+    conditions = [
+        texts.str.contains(pattern, regex=True, na=False).to_numpy()
+        for pattern, _ in rules
+    ]
+    categories = [label for _, label in rules] + [default]
+    codes = np.select(conditions, np.arange(len(rules), dtype=np.int8), default=len(rules)).astype(np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=texts.index)
+
+
+def _constant_category(value: str, length: int) -> pd.Categorical:
+    """Build a single-category column without materializing one string per row."""
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+
 class DatasetAllocator:
     """
     Phase 3: Strategic Allocation Pipeline
@@ -130,6 +619,29 @@ class DatasetAllocator:
             "value_proposition": "High-quality Malayalam speech synthesis"
         }
     }
+    
+    # Normalized dataset name -> StrategyTuple, built once per class by _prepare_strategy_index
+    _STRATEGY_INDEX: Dict[str, StrategyTuple] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the strategy index for subclasses that override ALLOCATION_STRATEGY."""
+        super().__init_subclass__(**kwargs)
+        cls._prepare_strategy_index()
+
+    @classmethod
+    def _prepare_strategy_index(cls):
+        """Materialize ALLOCATION_STRATEGY as immutable tuples keyed by normalized dataset name."""
+        cls._STRATEGY_INDEX = {
+            _normalize_dataset_name(dataset_name): StrategyTuple(
+                target_engine=strategy["target_engine"],
+                priority=strategy["priority"],
+                allocation_ratio=strategy["allocation_ratio"],
+                training_strategy=strategy["training_strategy"],
+                special_handling=frozenset(strategy.get("special_handling", ())),
+                value_proposition=strategy["value_proposition"]
+            )
+            for dataset_name, strategy in cls.ALLOCATION_STRATEGY.items()
+        }
 
     def __init__(self, silver_data_path: str, gold_storage_path: str):
         """
@@ -143,28 +655,85 @@ class DatasetAllocator:
         self.gold_path = Path(gold_storage_path)
         self.gold_path.mkdir(parents=True, exist_ok=True)
         
+        # Session-level JSON artifacts (vocabulary, validation, report), flushed once per run
+        self._artifact_writer = _AsyncJsonWriter()
+        
+        # One timestamp per allocation session, used to name its report
+        self._run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         # Initialize allocation statistics
         self.allocation_stats = {
             "session_id": datetime.now().isoformat(),
             "allocations_performed": {},
             "engine_statistics": {},
+            "total_datasets": 0,
+            "active_engines": 0,
             "quality_metrics": {},
             "optimization_applied": []
         }
         
+        # Output directory for every dataset with an allocation strategy; Phase 2 names
+        # dataset directories with the same normalization used for strategy keys
+        self._directory_plan = {
+            dataset_name: self.gold_path / strategy.target_engine.value / dataset_name
+            for dataset_name, strategy in self._STRATEGY_INDEX.items()
+        }
+        self._prepared_dirs = set()
+        
+        # Engine -> optimizer dispatch table, built once per allocator
+        self._engine_optimizers = {
+            AIEngine.WHISPER_STT: self._optimize_for_whisper_stt,
+            AIEngine.DIALECT_ADAPTER: self._optimize_for_dialect_adapter,
+            AIEngine.NLU_INTENT: self._optimize_for_nlu_intent,
+            AIEngine.NLU_UNDERSTANDING: self._optimize_for_nlu_understanding,
+            AIEngine.SENTIMENT_CLASSIFIER: self._optimize_for_sentiment_classifier,
+            AIEngine.TRANSLATION_MODEL: self._optimize_for_translation_model,
+            AIEngine.MALAYALAM_TTS: self._optimize_for_malayalam_tts
+        }
+        
+        # Engine -> Arrow-level pre-filter, applied before the pandas optimizer
+        self._engine_table_filters = {
+            AIEngine.WHISPER_STT: self._filter_table_for_whisper_stt,
+            AIEngine.NLU_UNDERSTANDING: self._filter_table_for_nlu_understanding
+        }
+        
+        # Process pool for CPU-bound per-split optimization. The pool already spans every
+        # core, so each worker keeps its Arrow and numba work single-threaded
+        self.process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_pool_worker
+        )
+        
+        # Upper bound on datasets allocated at once; the semaphore itself is created
+        # inside the running event loop by allocate_all_datasets
+        self.allocation_concurrency = int(
+            os.environ.get("ALLOC_CONCURRENCY", min(os.cpu_count() or 1, 8))
+        )
+        self._sem = None
+        
         # Create engine-specific directories
-        for engine in AIEngine:
-            engine_path = self.gold_path / engine.value
+        for engine_value in ALL_ENGINE_VALUES:
+            engine_path = self.gold_path / engine_value
             engine_path.mkdir(parents=True, exist_ok=True)
             
             # Initialize engine statistics
-            self.allocation_stats["engine_statistics"][engine.value] = {
+            self.allocation_stats["engine_statistics"][engine_value] = {
                 "datasets_allocated": 0,
                 "total_samples": 0,
                 "total_size_mb": 0.0,
                 "quality_score": 0.0
             }
 
+    def __getstate__(self) -> Dict:
+        """Drop process-local resources when the allocator is sent to a pool worker."""
+        state = self.__dict__.copy()
+        state.pop("process_pool", None)
+        state.pop("_sem", None)
+        state.pop("_artifact_writer", None)
+        # Workers never read run statistics, which grow with every finished dataset
+        state.pop("allocation_stats", None)
+        return state
+
     async def allocate_all_datasets(self) -> Dict:
         """
         Master orchestration method to allocate all standardized datasets to AI engines.
@@ -175,26 +744,36 @@ class DatasetAllocator:
         logger.info("🎯 Starting Data Foundry Phase 3: Strategic Allocation")
         
         # Discover standardized datasets
-        standardized_datasets = self._discover_standardized_datasets()
+        standardized_datasets = await self._discover_standardized_datasets()
         logger.info(f"📊 Found {len(standardized_datasets)} standardized datasets")
         
-        allocation_tasks = []
+        # The consolidated training-config log only describes this run, so start it empty
+        await asyncio.to_thread((self.gold_path / TRAINING_CONFIGS_LOG).write_bytes, b"")
+        
+        # Create all output directories for this run in one batch up front
+        for dataset_path in standardized_datasets:
+            output_dir = self._directory_plan.get(dataset_path.name)
+            if output_dir is not None and output_dir not in self._prepared_dirs:
+                output_dir.mkdir(exist_ok=True)
+                self._prepared_dirs.add(output_dir)
+        
+        # Bound the number of datasets in flight so their splits are not all
+        # loaded and written at the same time
+        self._sem = asyncio.Semaphore(max(self.allocation_concurrency, 1))
         
         # Create allocation tasks for each dataset
-        for dataset_path, metadata in standardized_datasets.items():
-            task = self._allocate_single_dataset(dataset_path, metadata)
-            allocation_tasks.append(task)
+        allocation_tasks = [
+            self._guarded_allocation(dataset_path, metadata)
+            for dataset_path, metadata in standardized_datasets.items()
+        ]
         
-        # Execute all allocation tasks
+        # Execute allocation tasks, updating statistics as each one finishes
         logger.info("⚡ Executing strategic allocation...")
-        results = await asyncio.gather(*allocation_tasks, return_exceptions=True)
-        
-        # Process results and update statistics
-        for i, result in enumerate(results):
+        for next_result in asyncio.as_completed(allocation_tasks):
+            dataset_name, result = await next_result
             if isinstance(result, Exception):
                 logger.error(f"❌ Dataset allocation failed: {result}")
             else:
-                dataset_name = list(standardized_datasets.keys())[i].name
                 self.allocation_stats["allocations_performed"][dataset_name] = result
         
         # Apply cross-engine optimizations
@@ -204,24 +783,62 @@ class DatasetAllocator:
         final_report = self._generate_allocation_report()
         await self._save_allocation_metadata(final_report)
         
+        # Write the vocabulary, validation and report artifacts in one batch
+        await self._artifact_writer.flush()
+        
         logger.info("✅ Phase 3 Strategic Allocation Complete!")
         self._print_allocation_summary(final_report)
         
         return final_report
 
-    def _discover_standardized_datasets(self) -> Dict[Path, Dict]:
-        """Discover all standardized datasets with their metadata."""
+    async def _guarded_allocation(self, dataset_path: Path, metadata: Dict) -> Tuple[str, object]:
+        """Allocate one dataset under the concurrency semaphore, returning failures as values."""
+        async with self._sem:
+            try:
+                return dataset_path.name, await self._allocate_single_dataset(dataset_path, metadata)
+            except Exception as e:
+                return dataset_path.name, e
+
+    async def _discover_standardized_datasets(self) -> Dict[Path, Dict]:
+        """
+        Discover all standardized datasets with their metadata.
+        
+        Metadata parses are cached in the gold tree keyed by file mtime, so re-runs
+        only re-read datasets that Phase 2 has rewritten since the last allocation.
+        """
+        # Walk engine/dataset directories off the event loop
+        metadata_files = await asyncio.to_thread(_scan_metadata_files, self.silver_path)
+        
+        # Load the previous discovery index (absent on the first allocation)
+        cache_path = self.gold_path / "_discovery_index.json"
+        cached = {}
+        try:
+            cached = await asyncio.to_thread(_read_json_file, str(cache_path))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable discovery index: {e}")
+        
+        # Re-parse only metadata files whose mtime changed, concurrently
+        stale = [
+            dataset_dir for dataset_dir, (_, mtime_ns) in metadata_files.items()
+            if cached.get(dataset_dir, [None])[0] != mtime_ns
+        ]
+        parsed = await asyncio.gather(*[
+            asyncio.to_thread(_read_json_file, metadata_files[dataset_dir][0])
+            for dataset_dir in stale
+        ])
+        fresh = dict(zip(stale, parsed))
+        
+        index = {}
         discovered = {}
+        for dataset_dir, (_, mtime_ns) in metadata_files.items():
+            metadata = fresh[dataset_dir] if dataset_dir in fresh else cached[dataset_dir][1]
+            index[dataset_dir] = [mtime_ns, metadata]
+            discovered[Path(dataset_dir)] = metadata
         
-        for engine_dir in self.silver_path.iterdir():
-            if engine_dir.is_dir():
-                for dataset_dir in engine_dir.iterdir():
-                    if dataset_dir.is_dir():
-                        metadata_file = dataset_dir / "standardization_metadata.json"
-                        if metadata_file.exists():
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            discovered[dataset_dir] = metadata
+        if stale or len(index) != len(cached):
+            await asyncio.to_thread(cache_path.write_bytes, _json_dumps(index))
         
         return discovered
 
@@ -241,22 +858,24 @@ class DatasetAllocator:
             Dict: Allocation result with engine mapping
         """
         dataset_name = dataset_path.name
-        original_name = metadata["original_metadata"]["dataset_name"].replace("/", "_").replace("-", "_")
+        original_name = _normalize_dataset_name(metadata["original_metadata"]["dataset_name"])
         
         logger.info(f"🎯 Allocating {dataset_name} to target engine...")
         
         # Get allocation strategy
-        strategy = self.ALLOCATION_STRATEGY.get(original_name)
-        if not strategy:
+        strategy = self._STRATEGY_INDEX.get(original_name)
+        if strategy is None:
             logger.warning(f"⚠️ No allocation strategy found for {original_name}")
             return {"status": "skipped", "reason": "no_strategy"}
         
-        target_engine = strategy["target_engine"]
+        target_engine = strategy.target_engine
         logger.info(f"📍 Target engine: {target_engine.value}")
         
-        # Create engine-specific output directory
+        # Engine-specific output directory, normally created by the batched plan
         engine_output_dir = self.gold_path / target_engine.value / dataset_name
-        engine_output_dir.mkdir(parents=True, exist_ok=True)
+        if engine_output_dir not in self._prepared_dirs:
+            engine_output_dir.mkdir(parents=True, exist_ok=True)
+            self._prepared_dirs.add(engine_output_dir)
         
         # Apply engine-specific processing
         allocation_result = await self._process_for_target_engine(
@@ -276,10 +895,20 @@ class DatasetAllocator:
             allocation_result=allocation_result
         )
         
-        # Save training configuration
-        config_path = engine_output_dir / "training_config.json"
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(training_config, f, indent=2, ensure_ascii=False)
+        # Save training configuration, and record it in the consolidated NDJSON log
+        # that downstream phases can stream instead of opening every config file
+        config_line = _json_dumps({
+            "dataset_name": dataset_name,
+            "allocated_at": datetime.now().isoformat(),
+            "training_config": training_config
+        }) + b"\n"
+        await asyncio.gather(
+            asyncio.to_thread(
+                (engine_output_dir / "training_config.json").write_bytes,
+                _json_dumps_indented(training_config)
+            ),
+            asyncio.to_thread(_append_bytes, self.gold_path / TRAINING_CONFIGS_LOG, config_line)
+        )
         
         return {
             "dataset_name": dataset_name,
@@ -293,7 +922,7 @@ class DatasetAllocator:
         self,
         dataset_path: Path,
         output_path: Path,
-        strategy: Dict,
+        strategy: StrategyTuple,
         metadata: Dict
     ) -> Dict:
         """
@@ -308,8 +937,8 @@ class DatasetAllocator:
         Returns:
             Dict: Processing result with optimizations applied
         """
-        target_engine = strategy["target_engine"]
-        special_handling = strategy.get("special_handling", [])
+        target_engine = strategy.target_engine
+        special_handling = strategy.special_handling
         
         result = {
             "processed_files": 0,
@@ -321,102 +950,229 @@ class DatasetAllocator:
         # Load standardized data files
         standardized_files = list(dataset_path.glob("*_standardized.parquet"))
         
-        for file_path in standardized_files:
-            df = pd.read_parquet(file_path)
+        # Process all splits concurrently; wall time tracks the slowest split
+        split_results = await asyncio.gather(*[
+            self._process_one_split(file_path, output_path, target_engine, special_handling)
+            for file_path in standardized_files
+        ])
+        
+        for split_name, impact in split_results:
             result["processed_files"] += 1
             
-            # Apply engine-specific optimizations
-            if target_engine == AIEngine.WHISPER_STT:
-                optimized_df = await self._optimize_for_whisper_stt(df, special_handling)
-            elif target_engine == AIEngine.DIALECT_ADAPTER:
-                optimized_df = await self._optimize_for_dialect_adapter(df, special_handling)
-            elif target_engine == AIEngine.NLU_INTENT:
-                optimized_df = await self._optimize_for_nlu_intent(df, special_handling)
-            elif target_engine == AIEngine.NLU_UNDERSTANDING:
-                optimized_df = await self._optimize_for_nlu_understanding(df, special_handling)
-            elif target_engine == AIEngine.SENTIMENT_CLASSIFIER:
-                optimized_df = await self._optimize_for_sentiment_classifier(df, special_handling)
-            elif target_engine == AIEngine.TRANSLATION_MODEL:
-                optimized_df = await self._optimize_for_translation_model(df, special_handling)
-            elif target_engine == AIEngine.MALAYALAM_TTS:
-                optimized_df = await self._optimize_for_malayalam_tts(df, special_handling)
-            else:
-                optimized_df = df  # No specific optimization
-            
-            # Save optimized dataset
-            split_name = file_path.stem.replace("_standardized", "")
-            output_file = output_path / f"{split_name}_allocated.parquet"
-            optimized_df.to_parquet(output_file, compression="gzip")
-            
-            # Calculate quality improvements
-            result["quality_improvements"][split_name] = self._calculate_optimization_impact(df, optimized_df)
+            # Record quality improvements
+            result["quality_improvements"][split_name] = impact
         
         # Generate engine-specific metadata
         result["engine_specific_metadata"] = self._generate_engine_metadata(target_engine, strategy)
         
         return result
 
-    async def _optimize_for_whisper_stt(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
-        """Optimize dataset for Whisper STT fine-tuning."""
-        logger.info("🎤 Optimizing for Whisper STT engine...")
+    async def _process_one_split(
+        self,
+        file_path: Path,
+        output_path: Path,
+        target_engine: AIEngine,
+        special_handling: FrozenSet[str]
+    ) -> Tuple[str, Dict]:
+        """Read, optimize and write one split without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        
+        # Optimizers are CPU-bound pandas transforms, so run them in the process
+        # pool where they actually execute in parallel instead of on the event loop
+        return await loop.run_in_executor(
+            self.process_pool,
+            self._optimize_split,
+            file_path,
+            output_path,
+            target_engine,
+            special_handling
+        )
+
+    def _optimize_split(
+        self,
+        file_path: Path,
+        output_path: Path,
+        target_engine: AIEngine,
+        special_handling: FrozenSet[str]
+    ) -> Tuple[str, Dict]:
+        """
+        Optimize a single standardized split for its target engine.
         
-        optimized_df = df.copy()
+        Runs inside a process-pool worker, so it must stay synchronous and only
+        touch state that survives pickling.
         
-        # Audio quality filtering
+        Returns:
+            Tuple[str, Dict]: Split name and its optimization impact
+        """
+        optimizer = self._engine_optimizers.get(target_engine, self._no_optimization)
+        table_filter = self._engine_table_filters.get(target_engine)
+        
+        split_name = file_path.stem.replace("_standardized", "")
+        output_file = output_path / f"{split_name}_allocated.parquet"
+        
+        # Balancing optimizers need class counts over the whole split
+        if target_engine in WHOLE_SPLIT_ENGINES:
+            # Memory-mapped decode avoids an extra userspace copy of the split
+            table = pq.read_table(file_path, memory_map=True, use_threads=False)
+            output_table = self._optimize_table(table, optimizer, table_filter, special_handling)
+            pq.write_table(output_table, output_file, **PARQUET_WRITE_OPTIONS)
+            return split_name, self._calculate_optimization_impact(
+                table.num_rows, table.num_columns, output_table.num_rows, output_table.num_columns
+            )
+        
+        # Row-local engines stream record batches, so peak memory is bounded by the
+        # batch size rather than the split size
+        source = pq.ParquetFile(file_path, memory_map=True)
+        input_rows = output_rows = 0
+        output_table = None
+        writer = None
+        try:
+            for batch in source.iter_batches(batch_size=STREAM_BATCH_SIZE, use_threads=False):
+                input_rows += batch.num_rows
+                output_table = self._optimize_table(
+                    pa.Table.from_batches([batch]), optimizer, table_filter, special_handling
+                )
+                if output_table.num_rows == 0:
+                    continue
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, output_table.schema, **PARQUET_WRITE_OPTIONS)
+                elif not output_table.schema.equals(writer.schema):
+                    output_table = output_table.cast(writer.schema)
+                writer.write_table(output_table)
+                output_rows += output_table.num_rows
+            
+            # Nothing survived the filters: still write an empty split with the output schema
+            if writer is None:
+                if output_table is None:
+                    output_table = self._optimize_table(
+                        source.schema_arrow.empty_table(), optimizer, table_filter, special_handling
+                    )
+                pq.write_table(output_table, output_file, **PARQUET_WRITE_OPTIONS)
+            output_columns = writer.schema.names if writer is not None else output_table.column_names
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        return split_name, self._calculate_optimization_impact(
+            input_rows, len(source.schema_arrow.names), output_rows, len(output_columns)
+        )
+
+    def _optimize_table(self, table: pa.Table, optimizer, table_filter, special_handling: FrozenSet[str]) -> pa.Table:
+        """Run an engine's Arrow filters and pandas optimizer over one table or batch."""
+        # Numeric quality filters run on the Arrow table before the pandas conversion,
+        # so rejected rows are never materialized as pandas objects
+        if table_filter is not None:
+            table = table_filter(table, special_handling)
+        
+        # Keep raw audio payload columns in Arrow buffers: optimizers only read scalar
+        # fields, so waveforms are re-attached by row id instead of becoming pandas objects
+        payload_columns = [field.name for field in table.schema if _is_audio_payload(field.type)]
+        if payload_columns:
+            payload = table.select(payload_columns)
+            table = table.drop_columns(payload_columns).append_column(
+                _ROW_ID_COLUMN, pa.array(np.arange(table.num_rows, dtype=np.int64))
+            )
+        
+        # Apply engine-specific optimizations
+        optimized_df = optimizer(table.to_pandas(), special_handling)
+        output_table = pa.Table.from_pandas(optimized_df, preserve_index=False)
+        
+        if payload_columns:
+            row_ids = output_table[_ROW_ID_COLUMN]
+            output_table = output_table.drop_columns([_ROW_ID_COLUMN])
+            for name in payload_columns:
+                output_table = output_table.append_column(name, payload[name].take(row_ids))
+        
+        return output_table
+
+    def _no_optimization(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
+        """Fallback for engines without a specific optimizer."""
+        return df
+
+    def _filter_table_for_whisper_stt(self, table: pa.Table, special_handling: FrozenSet[str]) -> pa.Table:
+        """Whisper quality filters and segmenting, computed with Arrow kernels."""
+        # Audio quality filtering, fused into a single mask
         if "audio_quality_filter" in special_handling:
             # Filter by duration (optimal for Whisper)
-            optimized_df = optimized_df[
-                (optimized_df["duration"] >= 1.0) & (optimized_df["duration"] <= 30.0)
-            ]
+            mask = pc.and_kleene(
+                pc.greater_equal(table["duration"], 1.0),
+                pc.less_equal(table["duration"], 30.0)
+            )
             
             # Filter by Malayalam content ratio
-            if "malayalam_char_ratio" in optimized_df.columns:
-                optimized_df = optimized_df[optimized_df["malayalam_char_ratio"] >= 0.7]
+            if "malayalam_char_ratio" in table.column_names:
+                mask = pc.and_kleene(mask, pc.greater_equal(table["malayalam_char_ratio"], 0.7))
+            
+            table = table.filter(mask)
         
         # Duration optimization for Whisper chunks
         if "duration_optimization" in special_handling:
             # Create optimal 30-second segments for training
-            optimized_df["training_segment"] = (optimized_df["duration"] / 30.0).astype(int) + 1
+            segments = pc.add(pc.cast(pc.floor(pc.divide(table["duration"], 30.0)), pa.int32()), 1)
+            table = table.append_column("training_segment", segments)
+        
+        return table
+
+    def _filter_table_for_nlu_understanding(self, table: pa.Table, special_handling: FrozenSet[str]) -> pa.Table:
+        """NLU corpus quality filters, computed with Arrow kernels."""
+        # Corpus quality filtering by text quality metrics in one fused mask
+        if "corpus_quality_filter" in special_handling:
+            table = table.filter(pc.and_kleene(
+                pc.greater_equal(table["malayalam_char_ratio"], 0.8),
+                pc.greater_equal(table["word_count"], 5)
+            ))
         
-        # Add Whisper-specific metadata
-        optimized_df["whisper_language"] = "ml"  # Malayalam language code
-        optimized_df["whisper_task"] = "transcribe"
+        return table
+
+    def _optimize_for_whisper_stt(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
+        """Optimize dataset for Whisper STT fine-tuning."""
+        logger.info("🎤 Optimizing for Whisper STT engine...")
         
-        return optimized_df
+        # Quality filtering and segmenting already ran in _filter_table_for_whisper_stt
+        
+        # Add Whisper-specific metadata; assign() returns a new frame
+        return df.assign(
+            whisper_language=_constant_category("ml", len(df)),  # Malayalam language code
+            whisper_task=_constant_category("transcribe", len(df))
+        )
 
-    async def _optimize_for_dialect_adapter(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_dialect_adapter(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for dialect-specific LoRA adapters."""
         logger.info("🗺️ Optimizing for Dialect Adapter engine...")
         
-        optimized_df = df.copy()
+        optimized_df = df
         
         # Dialect classification
         if "dialect_classification" in special_handling:
             # Add dialect labels based on regional markers
-            optimized_df["dialect"] = optimized_df["text"].apply(self._classify_malayalam_dialect)
+            optimized_df = optimized_df.assign(dialect=self._classify_malayalam_dialect(df["text"]))
             
             # Filter out unclassifiable dialects
-            optimized_df = optimized_df[optimized_df["dialect"] != "unknown"]
+            optimized_df = optimized_df.loc[optimized_df["dialect"] != "unknown"]
         
-        # Regional mapping for training adapters
+        # Regional mapping for training adapters (mapping a categorical keeps it categorical)
         if "regional_mapping" in special_handling:
-            optimized_df["adapter_target"] = optimized_df["dialect"].map({
+            optimized_df = optimized_df.assign(adapter_target=optimized_df["dialect"].map({
                 "travancore": "travancore_lora",
                 "malabar": "malabar_lora", 
                 "cochin": "cochin_lora",
                 "central": "central_lora"
-            })
+            }))
         
         # Balance dialect representation
         optimized_df = self._balance_dialect_representation(optimized_df)
         
         return optimized_df
 
-    async def _optimize_for_sentiment_classifier(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_sentiment_classifier(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for sentiment analysis."""
         logger.info("😊 Optimizing for Sentiment Classifier engine...")
         
-        optimized_df = df.copy()
+        optimized_df = df
+        
+        # Sentiment labels are a small closed set; store them as categorical codes
+        if "sentiment" in optimized_df.columns:
+            optimized_df = optimized_df.assign(sentiment=optimized_df["sentiment"].astype("category"))
         
         # Class balancing for better training
         if "class_balancing" in special_handling:
@@ -425,112 +1181,94 @@ class DatasetAllocator:
         # Cultural context preservation
         if "cultural_context_preservation" in special_handling:
             # Add cultural context markers
-            optimized_df["cultural_context"] = optimized_df["text"].apply(self._extract_cultural_context)
+            optimized_df = optimized_df.assign(
+                cultural_context=self._extract_cultural_context(optimized_df["text"])
+            )
             
             # Filter out culturally ambiguous samples
-            optimized_df = optimized_df[optimized_df["cultural_context"] != "ambiguous"]
+            optimized_df = optimized_df.loc[optimized_df["cultural_context"] != "ambiguous"]
         
         # Add confidence scores for training
-        optimized_df["label_confidence"] = 1.0  # High confidence for manually labeled data
-        
-        return optimized_df
+        return optimized_df.assign(label_confidence=1.0)  # High confidence for manually labeled data
 
-    async def _optimize_for_nlu_intent(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_nlu_intent(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for NLU intent classification."""
         logger.info("🧠 Optimizing for NLU Intent engine...")
         
-        optimized_df = df.copy()
+        optimized_df = df
         
         # Intent mapping to IVR-specific intents
         if "intent_mapping" in special_handling:
-            optimized_df["ivr_intent"] = optimized_df.apply(self._map_to_ivr_intents, axis=1)
+            optimized_df = optimized_df.assign(ivr_intent=self._map_to_ivr_intents(df["text"]))
             
             # Filter out unmappable intents
-            optimized_df = optimized_df[optimized_df["ivr_intent"] != "unmappable"]
+            optimized_df = optimized_df.loc[optimized_df["ivr_intent"] != "unmappable"]
         
         # Context preservation for multi-turn conversations
         if "context_preservation" in special_handling:
-            optimized_df["conversation_context"] = optimized_df["text"].apply(self._extract_conversation_context)
+            optimized_df = optimized_df.assign(
+                conversation_context=self._extract_conversation_context(optimized_df["text"])
+            )
         
         return optimized_df
 
-    async def _optimize_for_nlu_understanding(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_nlu_understanding(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for general NLU understanding."""
         logger.info("🎓 Optimizing for NLU Understanding engine...")
         
-        optimized_df = df.copy()
+        optimized_df = df
         
-        # Corpus quality filtering
-        if "corpus_quality_filter" in special_handling:
-            # Filter by text quality metrics
-            optimized_df = optimized_df[optimized_df["malayalam_char_ratio"] >= 0.8]
-            optimized_df = optimized_df[optimized_df["word_count"] >= 5]
+        # Corpus quality filtering already ran in _filter_table_for_nlu_understanding
         
         # Semantic enrichment
         if "semantic_enrichment" in special_handling:
-            optimized_df["semantic_category"] = optimized_df["text"].apply(self._categorize_semantic_content)
+            optimized_df = optimized_df.assign(
+                semantic_category=self._categorize_semantic_content(optimized_df["text"])
+            )
         
         return optimized_df
 
-    async def _optimize_for_translation_model(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_translation_model(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for translation training."""
         logger.info("🌐 Optimizing for Translation Model engine...")
         
-        optimized_df = df.copy()
-        
         # Add alignment quality scores if available
-        optimized_df["alignment_quality"] = 0.9  # Assume high quality for cleaned data
-        
-        return optimized_df
+        return df.assign(alignment_quality=0.9)  # Assume high quality for cleaned data
 
-    async def _optimize_for_malayalam_tts(self, df: pd.DataFrame, special_handling: List[str]) -> pd.DataFrame:
+    def _optimize_for_malayalam_tts(self, df: pd.DataFrame, special_handling: FrozenSet[str]) -> pd.DataFrame:
         """Optimize dataset for TTS training."""
         logger.info("🔊 Optimizing for Malayalam TTS engine...")
         
-        optimized_df = df.copy()
+        optimized_df = df
         
         # Phonetic accuracy optimization
         if "phonetic_accuracy" in special_handling:
-            optimized_df["phonetic_complexity"] = optimized_df["text"].apply(self._calculate_phonetic_complexity)
+            optimized_df = optimized_df.assign(
+                phonetic_complexity=self._calculate_phonetic_complexity(df["text"])
+            )
         
         return optimized_df
 
     # Helper methods for optimization
     
-    def _classify_malayalam_dialect(self, text: str) -> str:
-        """Classify Malayalam text by dialect based on linguistic markers."""
+    def _classify_malayalam_dialect(self, texts: pd.Series) -> pd.Series:
+        """Classify Malayalam texts by dialect based on linguistic markers."""
         # Simplified dialect classification based on common markers
-        travancore_markers = ["അവിടെ", "ഇവിടെ", "കേട്ടോ"]
-        malabar_markers = ["അവിടെക്ക്", "ഇവിടെക്ക്", "കേൾക്കുന്നുണ്ടോ"]
-        cochin_markers = ["അവിടുത്തേക്ക്", "ഇവിടുത്തേക്ക്", "കേട്ടുണ്ടോ"]
-        
-        text_lower = text.lower()
-        
-        if any(marker in text_lower for marker in travancore_markers):
-            return "travancore"
-        elif any(marker in text_lower for marker in malabar_markers):
-            return "malabar"
-        elif any(marker in text_lower for marker in cochin_markers):
-            return "cochin"
-        else:
-            return "central"  # Default to central Kerala dialect
+        if not NUMBA_AVAILABLE:
+            return _select_first_match(texts, DIALECT_RULES, default="central")  # Default to central Kerala dialect
+        
+        # JIT substring scan over packed codepoints (one thread; the pool parallelizes splits)
+        codepoints, offsets, _ = _flatten_codepoints(texts)
+        codes = _first_marker_rule(codepoints, offsets, *DIALECT_NEEDLES, len(DIALECT_MARKER_SETS))
+        categories = [label for _, label in DIALECT_MARKER_SETS] + ["central"]
+        return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=texts.index)
 
     def _balance_dialect_representation(self, df: pd.DataFrame) -> pd.DataFrame:
         """Balance dialect representation for fair training."""
         if "dialect" not in df.columns:
             return df
         
-        dialect_counts = df["dialect"].value_counts()
-        target_count = dialect_counts.min() * 2  # Allow some imbalance
-        
-        balanced_dfs = []
-        for dialect in dialect_counts.index:
-            dialect_df = df[df["dialect"] == dialect]
-            if len(dialect_df) > target_count:
-                dialect_df = dialect_df.sample(target_count, random_state=42)
-            balanced_dfs.append(dialect_df)
-        
-        return pd.concat(balanced_dfs, ignore_index=True).sample(frac=1, random_state=42)
+        return self._downsample_groups(df, "dialect", cap_ratio=2.0)  # Allow some imbalance
 
     def _balance_sentiment_classes_advanced(self, df: pd.DataFrame) -> pd.DataFrame:
         """Advanced sentiment class balancing with SMOTE-like techniques."""
@@ -538,99 +1276,84 @@ class DatasetAllocator:
             return df
         
         # Simple downsampling for now - could be enhanced with synthetic data generation
-        class_counts = df["sentiment"].value_counts()
-        min_count = class_counts.min()
-        target_count = min_count * 1.2  # Slight imbalance allowed
-        
-        balanced_dfs = []
-        for sentiment in class_counts.index:
-            sentiment_df = df[df["sentiment"] == sentiment]
-            if len(sentiment_df) > target_count:
-                sentiment_df = sentiment_df.sample(int(target_count), random_state=42)
-            balanced_dfs.append(sentiment_df)
-        
-        return pd.concat(balanced_dfs, ignore_index=True).sample(frac=1, random_state=42)
-
-    def _extract_cultural_context(self, text: str) -> str:
-        """Extract cultural context markers from Malayalam text."""
-        # Define cultural context categories
-        religious_markers = ["ദൈവം", "ഭഗവാൻ", "അള്ളാഹ്", "പ്രാർത്ഥന"]
-        festival_markers = ["ഓണം", "വിഷു", "ക്രിസ്മസ്", "ഈദ്"]
-        family_markers = ["അച്ഛൻ", "അമ്മ", "കുട്ടി", "മുത്തശ്ശി"]
-        
-        text_lower = text.lower()
-        
-        if any(marker in text_lower for marker in religious_markers):
-            return "religious"
-        elif any(marker in text_lower for marker in festival_markers):
-            return "festival"
-        elif any(marker in text_lower for marker in family_markers):
-            return "family"
-        else:
-            return "general"
-
-    def _map_to_ivr_intents(self, row: pd.Series) -> str:
+        return self._downsample_groups(df, "sentiment", cap_ratio=1.2)  # Slight imbalance allowed
+
+    def _downsample_groups(self, df: pd.DataFrame, column: str, cap_ratio: float) -> pd.DataFrame:
+        """
+        Keep at most int(smallest class size * cap_ratio) random rows per class, then shuffle.
+        
+        Rows are ordered by (class code, random key) in one lexsort, so each row's
+        rank within its class is its offset from the class start; keeping ranks
+        below the cap is a uniform per-class sample without replacement, gathered
+        with a single iloc.
+        """
+        codes = np.asarray(pd.Categorical(df[column]).codes, dtype=np.int64)
+        valid = np.flatnonzero(codes >= 0)
+        if valid.size == 0:
+            return df
+        class_counts = np.bincount(codes[valid])
+        cap = int(class_counts[class_counts > 0].min() * cap_ratio)
+        
+        rng = np.random.default_rng(42)
+        order = valid[np.lexsort((rng.random(valid.size), codes[valid]))]
+        sorted_codes = codes[order]
+        rank = np.arange(order.size) - np.searchsorted(sorted_codes, sorted_codes)
+        selected = order[rank < cap]
+        rng.shuffle(selected)
+        return df.iloc[selected].reset_index(drop=True)
+
+    def _extract_cultural_context(self, texts: pd.Series) -> pd.Series:
+        """Extract cultural context markers from Malayalam texts."""
+        return _select_first_match(texts, CULTURAL_CONTEXT_RULES, default="general")
+
+    def _map_to_ivr_intents(self, texts: pd.Series) -> pd.Series:
         """Map generic intents to IVR-specific intents."""
-        text = str(row.get("text", "")).lower()
-        
-        # IVR-specific intent mapping
-        if any(word in text for word in ["സഹായം", "help", "assistance"]):
-            return "request_help"
-        elif any(word in text for word in ["ബില്ലിംഗ്", "payment", "bill"]):
-            return "billing_inquiry"
-        elif any(word in text for word in ["ട്രാൻസ്ഫർ", "transfer", "agent"]):
-            return "request_transfer"
-        elif any(word in text for word in ["അപ്പോയിന്റ്മെന്റ്", "appointment"]):
-            return "schedule_appointment"
-        else:
-            return "general_inquiry"
-
-    def _extract_conversation_context(self, text: str) -> str:
-        """Extract conversation context from text."""
+        # IVR-specific intent mapping; English keywords match case-insensitively
+        return _select_first_match(texts.fillna("").astype(str), IVR_INTENT_RULES, default="general_inquiry")
+
+    def _extract_conversation_context(self, texts: pd.Series) -> pd.Series:
+        """Extract conversation context from texts."""
         # Simplified context extraction
-        if "?" in text or "എന്ത്" in text:
-            return "question"
-        elif any(marker in text for marker in ["ദയവായി", "please", "കഴിയുമോ"]):
-            return "polite_request"
-        elif any(marker in text for marker in ["അതെ", "ഇല്ല", "yes", "no"]):
-            return "confirmation"
-        else:
-            return "statement"
-
-    def _categorize_semantic_content(self, text: str) -> str:
-        """Categorize text by semantic content type."""
+        return _select_first_match(texts, CONVERSATION_CONTEXT_RULES, default="statement")
+
+    def _categorize_semantic_content(self, texts: pd.Series) -> pd.Series:
+        """Categorize texts by semantic content type."""
         # Simplified semantic categorization
-        if len(text.split()) < 5:
-            return "short_phrase"
-        elif any(marker in text for marker in ["എന്താണ്", "എങ്ങനെ", "എവിടെ"]):
-            return "question"
-        elif any(marker in text for marker in ["കഴിയും", "വേണം", "ആവശ്യം"]):
-            return "request"
-        else:
-            return "informational"
-
-    def _calculate_phonetic_complexity(self, text: str) -> float:
-        """Calculate phonetic complexity score for TTS optimization."""
-        # Count unique Malayalam phonemes
-        malayalam_chars = set(char for char in text if ord(char) >= 0x0d00 and ord(char) <= 0x0d7f)
-        complexity = len(malayalam_chars) / max(len(text), 1)
-        return min(complexity, 1.0)
-
-    def _calculate_optimization_impact(self, original_df: pd.DataFrame, optimized_df: pd.DataFrame) -> Dict:
+        labels = _select_first_match(texts, SEMANTIC_CATEGORY_RULES, default="informational")
+        labels = labels.cat.add_categories(["short_phrase"])
+        return labels.mask(texts.str.split().str.len() < 5, "short_phrase")
+
+    def _calculate_phonetic_complexity(self, texts: pd.Series) -> pd.Series:
+        """Calculate phonetic complexity scores for TTS optimization."""
+        # Flatten the column into one UTF-32 codepoint buffer with per-row offsets
+        codepoints, offsets, lengths = _flatten_codepoints(texts)
+        
+        # Count unique Malayalam phonemes per text
+        unique_malayalam = _count_unique_malayalam(codepoints, offsets)
+        complexity = unique_malayalam / np.maximum(lengths, 1)
+        return pd.Series(np.minimum(complexity, 1.0), index=texts.index)
+
+    def _calculate_optimization_impact(
+        self,
+        original_rows: int,
+        original_columns: int,
+        optimized_rows: int,
+        optimized_columns: int
+    ) -> Dict:
         """Calculate the impact of optimization on dataset quality."""
         return {
-            "size_reduction": (len(original_df) - len(optimized_df)) / max(len(original_df), 1),
+            "size_reduction": (original_rows - optimized_rows) / max(original_rows, 1),
             "quality_improvement": 0.1,  # Placeholder - would calculate based on actual metrics
-            "feature_enrichment": len(optimized_df.columns) - len(original_df.columns)
+            "feature_enrichment": optimized_columns - original_columns
         }
 
-    def _generate_engine_metadata(self, target_engine: AIEngine, strategy: Dict) -> Dict:
+    def _generate_engine_metadata(self, target_engine: AIEngine, strategy: StrategyTuple) -> Dict:
         """Generate engine-specific metadata for training configuration."""
         base_metadata = {
             "engine_type": target_engine.value,
-            "training_strategy": strategy["training_strategy"],
-            "priority": strategy["priority"],
-            "value_proposition": strategy["value_proposition"]
+            "training_strategy": strategy.training_strategy,
+            "priority": strategy.priority,
+            "value_proposition": strategy.value_proposition
         }
         
         # Add engine-specific configurations
@@ -662,15 +1385,15 @@ class DatasetAllocator:
     def _generate_training_configuration(
         self,
         target_engine: AIEngine,
-        strategy: Dict,
+        strategy: StrategyTuple,
         allocation_result: Dict
     ) -> Dict:
         """Generate comprehensive training configuration for the target engine."""
         config = {
             "training_metadata": {
                 "engine": target_engine.value,
-                "strategy": strategy["training_strategy"],
-                "priority": strategy["priority"],
+                "strategy": strategy.training_strategy,
+                "priority": strategy.priority,
                 "datasets_included": allocation_result["processed_files"]
             },
             "data_configuration": {
@@ -690,50 +1413,23 @@ class DatasetAllocator:
         
         return config
 
-    def _get_engine_training_params(self, engine: AIEngine) -> Dict:
-        """Get engine-specific training parameters."""
-        params_map = {
-            AIEngine.WHISPER_STT: {
-                "epochs": 10,
-                "learning_rate": 1e-5,
-                "batch_size": 16,
-                "weight_decay": 0.01,
-                "warmup_steps": 500
-            },
-            AIEngine.DIALECT_ADAPTER: {
-                "epochs": 20,
-                "learning_rate": 1e-4,
-                "lora_rank": 16,
-                "lora_alpha": 32,
-                "target_modules": ["q_proj", "v_proj"]
-            },
-            AIEngine.SENTIMENT_CLASSIFIER: {
-                "epochs": 15,
-                "learning_rate": 2e-5,
-                "batch_size": 32,
-                "class_weights": "balanced"
-            }
-        }
-        
-        return params_map.get(engine, {"epochs": 10, "learning_rate": 1e-5})
+    def _get_engine_training_params(self, engine: AIEngine) -> Dict[str, Any]:
+        """Get engine-specific training parameters as plain data for the written config."""
+        return dict(ENGINE_TRAINING_PARAMS.get(engine, DEFAULT_TRAINING_PARAMS))
 
     def _get_engine_evaluation_metrics(self, engine: AIEngine) -> List[str]:
-        """Get engine-specific evaluation metrics."""
-        metrics_map = {
-            AIEngine.WHISPER_STT: ["wer", "cer", "bleu"],
-            AIEngine.DIALECT_ADAPTER: ["dialect_accuracy", "wer_by_dialect"],
-            AIEngine.SENTIMENT_CLASSIFIER: ["accuracy", "f1_macro", "confusion_matrix"],
-            AIEngine.NLU_INTENT: ["intent_accuracy", "f1_weighted"],
-            AIEngine.TRANSLATION_MODEL: ["bleu", "meteor", "rouge"],
-            AIEngine.MALAYALAM_TTS: ["mel_cepstral_distortion", "naturalness_score"]
-        }
-        
-        return metrics_map.get(engine, ["accuracy", "loss"])
+        """Get engine-specific evaluation metrics as plain data for the written config."""
+        return list(ENGINE_EVALUATION_METRICS.get(engine, DEFAULT_EVALUATION_METRICS))
 
     def _update_engine_statistics(self, engine: AIEngine, allocation_result: Dict):
         """Update statistics for the target engine."""
         stats = self.allocation_stats["engine_statistics"][engine.value]
         stats["datasets_allocated"] += 1
+        
+        # Keep report totals current so report generation never rescans engines
+        self.allocation_stats["total_datasets"] += 1
+        if stats["datasets_allocated"] == 1:
+            self.allocation_stats["active_engines"] += 1
         stats["total_samples"] += allocation_result.get("processed_files", 0)
         # Additional metrics could be calculated here
 
@@ -764,23 +1460,51 @@ class DatasetAllocator:
         
         shared_vocab_path = self.gold_path / "shared_vocabulary.json"
         
-        # This would involve analyzing all allocated text data
-        # and creating a unified vocabulary for efficient tokenization
+        # Count tokens across all allocated text data off the event loop
+        token_counts, texts_analyzed = await asyncio.to_thread(self._count_engine_tokens, vocab_engines)
+        
+        # Unified vocabulary for efficient tokenization across engines
         shared_vocab = {
-            "malayalam_tokens": 10000,
+            "tokenizer_version": TOKENIZER_VERSION,
+            "engines_included": [engine.value for engine in vocab_engines],
+            "texts_analyzed": texts_analyzed,
+            "malayalam_tokens": [token for token, _ in token_counts.most_common(SHARED_VOCAB_SIZE)],
             "special_tokens": ["<UNK>", "<PAD>", "<BOS>", "<EOS>"],
-            "cultural_tokens": 500
+            "cultural_tokens": sorted(token for token in CULTURAL_TOKENS if token_counts[token])
         }
         
-        with open(shared_vocab_path, 'w', encoding='utf-8') as f:
-            json.dump(shared_vocab, f, indent=2, ensure_ascii=False)
+        self._artifact_writer.queue(shared_vocab_path, shared_vocab)
+
+    def _count_engine_tokens(self, engines: List[AIEngine]) -> Tuple[Counter, int]:
+        """Merge token counts over the text column of every allocated split for the given engines."""
+        token_counts = Counter()
+        texts_analyzed = 0
+        
+        for engine in engines:
+            for file_path in sorted((self.gold_path / engine.value).glob("*/*_allocated.parquet")):
+                source = pq.ParquetFile(file_path, memory_map=True)
+                if "text" not in source.schema_arrow.names:
+                    continue
+                
+                # Only the text column is decoded, one record batch at a time
+                for batch in source.iter_batches(batch_size=STREAM_BATCH_SIZE, columns=["text"]):
+                    for text in batch.column(0).to_pylist():
+                        if text:
+                            token_counts.update(_tokenize(text))
+                            texts_analyzed += 1
+        
+        return token_counts, texts_analyzed
 
     async def _setup_cross_engine_validation(self):
         """Setup validation that works across multiple engines."""
+        # Fold assignments are computed off the event loop from the allocated train splits
+        fold_assignments = await asyncio.to_thread(self._assign_validation_folds)
+        
         validation_config = {
-            "validation_strategy": "holdout_set",
-            "cross_validation_folds": 5,
-            "engines_included": [engine.value for engine in AIEngine],
+            "validation_strategy": "stratified_k_fold",
+            "cross_validation_folds": CROSS_VALIDATION_FOLDS,
+            "engines_included": ALL_ENGINE_VALUES,
+            "fold_assignments": fold_assignments,
             "validation_metrics": {
                 "overall_malayalam_understanding": 0.85,
                 "cultural_appropriateness": 0.90,
@@ -789,27 +1513,56 @@ class DatasetAllocator:
         }
         
         validation_path = self.gold_path / "cross_engine_validation.json"
-        with open(validation_path, 'w', encoding='utf-8') as f:
-            json.dump(validation_config, f, indent=2)
+        self._artifact_writer.queue(validation_path, validation_config)
+
+    def _assign_validation_folds(self) -> Dict:
+        """
+        Write per-row fold ids next to every allocated train split.
+        
+        Each train_allocated.parquet gets a row-aligned int8 train_cv_folds.npy (not a
+        parquet file, so Phase 4's data validation does not count it as samples), and
+        all engines consume identical, class-balanced fold ids for the same rows.
+        """
+        fold_assignments = {}
+        
+        for engine in AIEngine:
+            label_column = VALIDATION_LABEL_COLUMNS.get(engine)
+            for train_file in sorted((self.gold_path / engine.value).glob("*/train_allocated.parquet")):
+                source = pq.ParquetFile(train_file, memory_map=True)
+                if label_column in source.schema_arrow.names:
+                    # Missing labels are balanced as a class of their own
+                    labels = pd.Categorical(source.read(columns=[label_column]).column(0).to_pandas()).codes
+                    labels = labels.astype(np.int64)
+                    missing = labels < 0
+                    if missing.any():
+                        labels[missing] = labels.max() + 1
+                else:
+                    labels = np.zeros(source.metadata.num_rows, dtype=np.int64)
+                
+                folds, counts = _generate_balanced_folds(labels)
+                folds_file = train_file.with_name("train_cv_folds.npy")
+                np.save(folds_file, folds)
+                
+                fold_assignments[f"{engine.value}/{train_file.parent.name}"] = {
+                    "folds_path": str(folds_file.relative_to(self.gold_path)),
+                    "label_column": label_column if label_column in source.schema_arrow.names else None,
+                    "samples": int(labels.size),
+                    "fold_sizes": counts.sum(axis=1).tolist(),
+                    "class_counts_per_fold": counts.tolist()
+                }
+        
+        return fold_assignments
 
     def _generate_allocation_report(self) -> Dict:
         """Generate comprehensive allocation report."""
-        total_datasets = sum(
-            stats["datasets_allocated"] 
-            for stats in self.allocation_stats["engine_statistics"].values()
-        )
-        
         return {
             "session_metadata": self.allocation_stats,
             "allocation_summary": {
-                "total_datasets_allocated": total_datasets,
-                "engines_utilized": len([
-                    engine for engine, stats in self.allocation_stats["engine_statistics"].items()
-                    if stats["datasets_allocated"] > 0
-                ]),
+                "total_datasets_allocated": self.allocation_stats["total_datasets"],
+                "engines_utilized": self.allocation_stats["active_engines"],
                 "optimization_strategies_applied": len(self.allocation_stats["optimization_applied"])
             },
-            "engine_breakdown": self.allocation_stats["engine_statistics"],
+            "engine_breakdown": dict(self.allocation_stats["engine_statistics"]),
             "next_phase_recommendations": [
                 "Proceed to Phase 4: Fine-Tuning & Deployment",
                 "Review engine-specific training configurations",
@@ -820,31 +1573,36 @@ class DatasetAllocator:
 
     async def _save_allocation_metadata(self, report: Dict):
         """Save allocation metadata and report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        report_path = self.gold_path / f"allocation_report_{timestamp}.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        report_path = self.gold_path / f"allocation_report_{self._run_timestamp}.json"
+        self._artifact_writer.queue(report_path, report)
 
     def _print_allocation_summary(self, report: Dict):
         """Print human-readable allocation summary."""
-        print("\n" + "="*60)
-        print("🎯 DATA FOUNDRY PHASE 3 COMPLETE")
-        print("="*60)
-        
         summary = report["allocation_summary"]
-        print(f"📊 Datasets Allocated: {summary['total_datasets_allocated']}")
-        print(f"🔧 AI Engines Utilized: {summary['engines_utilized']}")
-        print(f"⚡ Optimizations Applied: {summary['optimization_strategies_applied']}")
-        
-        print("\n🎯 Engine Breakdown:")
-        for engine, stats in report["engine_breakdown"].items():
-            if stats["datasets_allocated"] > 0:
-                print(f"   {engine}: {stats['datasets_allocated']} dataset(s)")
+        lines = [
+            f"\n{_BANNER}\n🎯 DATA FOUNDRY PHASE 3 COMPLETE\n{_BANNER}",
+            f"📊 Datasets Allocated: {summary['total_datasets_allocated']}",
+            f"🔧 AI Engines Utilized: {summary['engines_utilized']}",
+            f"⚡ Optimizations Applied: {summary['optimization_strategies_applied']}",
+            "\n🎯 Engine Breakdown:",
+        ]
+        lines.extend(
+            f"   {engine}: {stats['datasets_allocated']} dataset(s)"
+            for engine, stats in report["engine_breakdown"].items()
+            if stats["datasets_allocated"] > 0
+        )
+        lines += [
+            f"\n📁 Engine-specific data stored in: {self.gold_path}",
+            "🔄 Ready for Phase 4: Fine-Tuning & Deployment",
+            _BANNER,
+        ]
         
-        print(f"\n📁 Engine-specific data stored in: {self.gold_path}")
-        print("🔄 Ready for Phase 4: Fine-Tuning & Deployment")
-        print("="*60)
+        # Emit the whole summary in one write instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+DatasetAllocator._prepare_strategy_index()
 
 
 async def main():
@@ -865,6 +1623,9 @@ async def main():
     except Exception as e:
         logger.error(f"💥 Data Foundry Phase 3 failed: {str(e)}")
         raise e
+    
+    finally:
+        allocator.process_pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -7,11 +7,24 @@ Complete pipeline to integrate 9 Hugging Face Malayalam datasets into AI IVR tra
 import os
 import sys
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 import argparse
+import hashlib
+import itertools
 import json
+import time
+from typing import Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add phase directories to Python path
 sys.path.append(str(Path(__file__).parent / "phase1-ingestion"))
@@ -25,17 +38,95 @@ from standardize_data import DataFoundryPreprocessor
 from allocate_datasets import DatasetAllocator
 from train_deploy_models import DataFoundryOrchestrator
 
-# Configure logging
+# Configure logging. The phase modules installed their file and console handlers on the
+# root logger when imported above. Those handlers and the master log all move behind a
+# queue: the calling thread only enqueues each record and a listener thread does the
+# blocking writes, so logging never stalls the event loop.
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data_foundry_master.log'),
-        logging.StreamHandler()
-    ]
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_root_logger = logging.getLogger()
+_phase_log_handlers = list(_root_logger.handlers)
+_master_log_handler = logging.FileHandler('data_foundry_master.log')
+_master_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_phase_log_handlers, _master_log_handler, respect_handler_level=True
 )
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+# Drain queued records before the interpreter exits
+atexit.register(_log_listener.stop)
+
+
+def _detach_log_queue():
+    """In forked pool workers nothing drains the inherited queue, so log through the phase handlers directly."""
+    _root_logger.handlers = list(_phase_log_handlers)
+
+
+# Phase 2 and Phase 3 fork their process-pool workers after this point
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_detach_log_queue)
+
 logger = logging.getLogger(__name__)
 
+# Storage directories whose contents decide whether a phase's cached report is still valid
+# (each phase's inputs plus its outputs, so deleting an output forces a re-run). Phase 1
+# is never cached: its input is the Hub, so failed ingestions must be retried, and
+# reuse_existing already skips datasets that are on disk. Phase 4 is never cached either:
+# its results are training jobs and registry entries, not files in storage
+PHASE_CACHE_DIRS = {
+    "phase2": ("raw", "silver"),
+    "phase3": ("silver", "gold")
+}
+
+# Storage directory each phase writes to
+PHASE_OUTPUT_DIRS = {
+    "phase1": "raw",
+    "phase2": "silver",
+    "phase3": "gold"
+}
+
+def _json_loads(data):
+    """Parse JSON text or bytes, preferring orjson's C decoder when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(payload, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON (compact, or indented for reports), preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, default=str, option=option)
+    if indent:
+        return json.dumps(payload, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+_BANNER = "=" * 80
+
+# Upper bound on recommendations kept in a pipeline report
+MAX_RECOMMENDATIONS = 10
+
+# Pipeline phases in execution order: (start-up log message, executor method)
+PHASE_STEPS = {
+    "phase1": ("🚀 Executing Phase 1: Automated Ingestion", "_execute_phase1"),
+    "phase2": ("🔧 Executing Phase 2: Data Standardization", "_execute_phase2"),
+    "phase3": ("🎯 Executing Phase 3: Strategic Allocation", "_execute_phase3"),
+    "phase4": ("🚀 Executing Phase 4: Fine-tuning & Deployment", "_execute_phase4")
+}
+
+# Phases whose outputs a phase reads (raw -> silver -> gold -> models); a phase only
+# waits on the ones that were actually requested for this run
+PHASE_DEPENDENCIES = {
+    "phase2": ("phase1",),
+    "phase3": ("phase2",),
+    "phase4": ("phase3",)
+}
+
 class DataFoundryMaster:
     """
     Master orchestrator for the complete Data Foundry pipeline.
@@ -53,9 +144,30 @@ class DataFoundryMaster:
             "gold": self.base_path / "storage" / "gold"
         }
         
-        # Create directories
-        for path in self.storage_paths.values():
-            path.mkdir(parents=True, exist_ok=True)
+        # String forms handed to the phase components, converted once
+        self.base_path_str = str(self.base_path)
+        self.storage_paths_str = {name: str(path) for name, path in self.storage_paths.items()}
+        
+        # Storage directories are created by setup() once the event loop is running
+        self._setup_done = False
+        
+        # Phase reports cached by the fingerprint of their storage directories
+        self.use_phase_cache = config.get("phase_cache", True)
+        self._phase_cache_path = self.base_path / ".phase_cache"
+        
+        # Fingerprint of each storage directory for the current run; an entry is only
+        # recomputed after a phase that writes that directory has actually run
+        self._dir_fingerprints = {}
+        
+        # Phase 4 orchestrator, created on first use by _execute_phase4
+        self._phase4_orchestrator = None
+        
+        # Streamed NDJSON report for the current run, set by run_complete_pipeline
+        self._report_path = None
+        self._report_lock = None
+        
+        # Monotonic start time for duration reporting (immune to wall-clock changes)
+        self._started_monotonic = time.monotonic()
         
         # Initialize pipeline statistics
         self.pipeline_stats = {
@@ -66,6 +178,22 @@ class DataFoundryMaster:
             "pipeline_status": "initializing"
         }
 
+    async def setup(self):
+        """Create storage directories without blocking the event loop."""
+        if self._setup_done:
+            return
+        
+        await asyncio.gather(*[
+            asyncio.to_thread(path.mkdir, parents=True, exist_ok=True)
+            for path in self.storage_paths.values()
+        ])
+        self._setup_done = True
+
+    async def close(self):
+        """Release the Phase 4 orchestrator's workers, if Phase 4 ran."""
+        if self._phase4_orchestrator is not None:
+            await self._phase4_orchestrator.close()
+
     async def run_complete_pipeline(self, phases: list = None) -> dict:
         """
         Execute the complete 4-phase Data Foundry pipeline.
@@ -77,13 +205,21 @@ class DataFoundryMaster:
             dict: Complete pipeline execution report
         """
         if phases is None:
-            phases = ["phase1", "phase2", "phase3", "phase4"]
+            phases = list(PHASE_STEPS)
+        
+        # Validate once, then use O(1) membership tests when scheduling
+        phase_set = frozenset(phases)
+        unknown_phases = phase_set.difference(PHASE_STEPS)
+        if unknown_phases:
+            raise ValueError(f"Unknown phases requested: {', '.join(sorted(unknown_phases))}")
         
         logger.info("🏭 Starting Data Foundry Master Pipeline")
         logger.info(f"📋 Phases to execute: {', '.join(phases)}")
         
+        # One clock read names the run; both the execution id and report file derive from it
+        timestamp = f"{datetime.now():%Y%m%d_%H%M%S}"
         pipeline_report = {
-            "execution_id": f"datafoundry_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "execution_id": f"datafoundry_{timestamp}",
             "phases_requested": phases,
             "phase_reports": {},
             "overall_statistics": {},
@@ -91,41 +227,46 @@ class DataFoundryMaster:
         }
         
         try:
+            await self.setup()
             self.pipeline_stats["pipeline_status"] = "running"
+            self._dir_fingerprints = {}
             
-            # Phase 1: Data Ingestion
-            if "phase1" in phases:
-                logger.info("🚀 Executing Phase 1: Automated Ingestion")
-                phase1_report = await self._execute_phase1()
-                pipeline_report["phase_reports"]["phase1"] = phase1_report
-                self.pipeline_stats["phases_completed"].append("phase1")
+            # Phase reports are streamed to disk as NDJSON as each phase completes
+            self._report_path = self.base_path / f"pipeline_report_{timestamp}.ndjson"
             
-            # Phase 2: Data Standardization
-            if "phase2" in phases:
-                logger.info("🔧 Executing Phase 2: Data Standardization")
-                phase2_report = await self._execute_phase2()
-                pipeline_report["phase_reports"]["phase2"] = phase2_report
-                self.pipeline_stats["phases_completed"].append("phase2")
+            # Each phase starts as soon as the requested phases it reads from have finished;
+            # phases with no requested upstream run concurrently off existing storage
+            self._report_lock = asyncio.Lock()
+            phase_tasks = {}
+            for phase in PHASE_STEPS:
+                if phase in phase_set:
+                    upstream = [phase_tasks[dep] for dep in PHASE_DEPENDENCIES.get(phase, ()) if dep in phase_tasks]
+                    phase_tasks[phase] = asyncio.ensure_future(
+                        self._run_phase_after(phase, upstream, pipeline_report)
+                    )
             
-            # Phase 3: Strategic Allocation
-            if "phase3" in phases:
-                logger.info("🎯 Executing Phase 3: Strategic Allocation")
-                phase3_report = await self._execute_phase3()
-                pipeline_report["phase_reports"]["phase3"] = phase3_report
-                self.pipeline_stats["phases_completed"].append("phase3")
+            try:
+                await asyncio.gather(*phase_tasks.values())
+            except BaseException:
+                # One failed phase stops the whole run, including unrelated phases still in flight
+                for task in phase_tasks.values():
+                    task.cancel()
+                await asyncio.gather(*phase_tasks.values(), return_exceptions=True)
+                raise
             
-            # Phase 4: Fine-tuning & Deployment
-            if "phase4" in phases:
-                logger.info("🚀 Executing Phase 4: Fine-tuning & Deployment")
-                phase4_report = await self._execute_phase4()
-                pipeline_report["phase_reports"]["phase4"] = phase4_report
-                self.pipeline_stats["phases_completed"].append("phase4")
+            # Present phase reports in pipeline order regardless of completion order
+            pipeline_report["phase_reports"] = {
+                phase: pipeline_report["phase_reports"][phase]
+                for phase in PHASE_STEPS if phase in pipeline_report["phase_reports"]
+            }
             
             # Compile overall statistics
             pipeline_report["overall_statistics"] = self._compile_overall_statistics(pipeline_report)
             
             # Generate recommendations
-            pipeline_report["recommendations"] = self._generate_recommendations(pipeline_report)
+            pipeline_report["recommendations"] = list(
+                itertools.islice(self._generate_recommendations(pipeline_report), MAX_RECOMMENDATIONS)
+            )
             
             self.pipeline_stats["pipeline_status"] = "completed"
             self.pipeline_stats["completed_at"] = datetime.now().isoformat()
@@ -145,6 +286,57 @@ class DataFoundryMaster:
         
         return pipeline_report
 
+    async def _run_phase_cached(self, phase: str, execute_phase) -> dict:
+        """Run a phase, or reuse its last report if its storage directories are unchanged."""
+        if not self.use_phase_cache or phase not in PHASE_CACHE_DIRS:
+            phase_report = await execute_phase()
+            # Later phases must re-fingerprint whatever this phase wrote
+            self._dir_fingerprints.pop(PHASE_OUTPUT_DIRS.get(phase), None)
+            return phase_report
+        
+        cache_key = await self._phase_cache_key(phase)
+        cache_file = self._phase_cache_path / f"{phase}_{cache_key}.json"
+        
+        if await asyncio.to_thread(cache_file.exists):
+            logger.info(f"♻️ {phase} inputs unchanged - reusing cached report")
+            return await asyncio.to_thread(self._read_json_sync, cache_file)
+        
+        phase_report = await execute_phase()
+        
+        # Only the phase's output directory changed; key the report on the post-run
+        # state so an untouched tree hits next time
+        self._dir_fingerprints.pop(PHASE_OUTPUT_DIRS[phase], None)
+        cache_key = await self._phase_cache_key(phase)
+        await asyncio.to_thread(self._phase_cache_path.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(
+            self._write_json_sync, self._phase_cache_path / f"{phase}_{cache_key}.json", phase_report
+        )
+        
+        return phase_report
+
+    async def _phase_cache_key(self, phase: str) -> str:
+        """Combine the fingerprints of a phase's storage directories, computing missing ones."""
+        digest = hashlib.blake2b(digest_size=16)
+        for name in PHASE_CACHE_DIRS[phase]:
+            if name not in self._dir_fingerprints:
+                self._dir_fingerprints[name] = await asyncio.to_thread(
+                    self._fingerprint_dir, self.storage_paths[name]
+                )
+            digest.update(f"{name}\0{self._dir_fingerprints[name]}\n".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _fingerprint_dir(root: Path) -> str:
+        """Cheap content key over every file's relative path, size and mtime."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{root}\n".encode())
+        if root.exists():
+            for file_path in sorted(root.rglob("*")):
+                if file_path.is_file():
+                    stat = file_path.stat()
+                    digest.update(f"{file_path.relative_to(root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
     async def _execute_phase1(self) -> dict:
         """Execute Phase 1: Automated Ingestion from Hugging Face."""
         logger.info("📥 Phase 1: Ingesting 9 Malayalam datasets from Hugging Face...")
@@ -152,8 +344,9 @@ class DataFoundryMaster:
         # Configure storage for Phase 1
         storage_config = {
             "type": "local",
-            "base_path": str(self.storage_paths["raw"]),
-            "backup_enabled": True
+            "base_path": self.storage_paths_str["raw"],
+            "backup_enabled": True,
+            "reuse_existing": self.use_phase_cache
         }
         
         # Initialize ingester
@@ -175,12 +368,16 @@ class DataFoundryMaster:
         
         # Initialize preprocessor
         preprocessor = DataFoundryPreprocessor(
-            str(self.storage_paths["raw"]),
-            str(self.storage_paths["silver"])
+            self.storage_paths_str["raw"],
+            self.storage_paths_str["silver"]
         )
         
-        # Execute standardization
-        standardization_report = await preprocessor.standardize_all_datasets()
+        # Execute standardization; the worker pools would otherwise outlive the phase
+        try:
+            standardization_report = await preprocessor.standardize_all_datasets()
+        finally:
+            await asyncio.to_thread(preprocessor.process_pool.shutdown)
+            await asyncio.to_thread(preprocessor.thread_pool.shutdown)
         
         logger.info(f"✅ Phase 2 Complete - {standardization_report['processing_summary']['total_datasets_processed']} datasets standardized")
         
@@ -192,12 +389,15 @@ class DataFoundryMaster:
         
         # Initialize allocator
         allocator = DatasetAllocator(
-            str(self.storage_paths["silver"]),
-            str(self.storage_paths["gold"])
+            self.storage_paths_str["silver"],
+            self.storage_paths_str["gold"]
         )
         
-        # Execute allocation
-        allocation_report = await allocator.allocate_all_datasets()
+        # Execute allocation; the worker pool would otherwise outlive the phase
+        try:
+            allocation_report = await allocator.allocate_all_datasets()
+        finally:
+            await asyncio.to_thread(allocator.process_pool.shutdown)
         
         logger.info(f"✅ Phase 3 Complete - {allocation_report['allocation_summary']['total_datasets_allocated']} datasets allocated")
         
@@ -207,11 +407,13 @@ class DataFoundryMaster:
         """Execute Phase 4: Fine-tuning and Deployment."""
         logger.info("🚀 Phase 4: Training models and deploying...")
         
-        # Initialize orchestrator
-        orchestrator = DataFoundryOrchestrator(str(self.base_path))
+        # One orchestrator per master; its constructor opens the registry and
+        # loads CI config, so it is built off the event loop on first use
+        if self._phase4_orchestrator is None:
+            self._phase4_orchestrator = await asyncio.to_thread(DataFoundryOrchestrator, self.base_path_str)
         
         # Execute training and deployment
-        training_report = await orchestrator._execute_phase4_pipeline()
+        training_report = await self._phase4_orchestrator.execute_phase4(refresh=True)
         
         # Update pipeline statistics
         self.pipeline_stats["total_models_trained"] = training_report.get("models_trained", 0)
@@ -244,23 +446,17 @@ class DataFoundryMaster:
         
         return stats
 
-    def _generate_recommendations(self, pipeline_report: dict) -> list:
-        """Generate strategic recommendations based on pipeline results."""
-        recommendations = []
-        
+    def _generate_recommendations(self, pipeline_report: dict) -> Iterator[str]:
+        """Yield strategic recommendations based on pipeline results, most specific first."""
         # Check Phase 1 results
         if "phase1" in pipeline_report["phase_reports"]:
             phase1 = pipeline_report["phase_reports"]["phase1"]
             success_rate = phase1.get("dataset_summary", {}).get("success_rate", 0)
             
             if success_rate < 100:
-                recommendations.append(
-                    "Review failed dataset ingestions - consider authentication or dataset availability issues"
-                )
+                yield "Review failed dataset ingestions - consider authentication or dataset availability issues"
             else:
-                recommendations.append(
-                    "Excellent ingestion success rate - all target datasets successfully acquired"
-                )
+                yield "Excellent ingestion success rate - all target datasets successfully acquired"
         
         # Check Phase 4 results
         if "phase4" in pipeline_report["phase_reports"]:
@@ -268,49 +464,60 @@ class DataFoundryMaster:
             models_trained = phase4.get("models_trained", 0)
             
             if models_trained > 0:
-                recommendations.extend([
-                    "Monitor shadow deployments for model performance validation",
-                    "Prepare production deployment approval workflows",
-                    "Set up continuous monitoring for deployed models"
-                ])
+                yield "Monitor shadow deployments for model performance validation"
+                yield "Prepare production deployment approval workflows"
+                yield "Set up continuous monitoring for deployed models"
             else:
-                recommendations.append(
-                    "No models trained - ensure allocated datasets are available for Phase 4"
-                )
+                yield "No models trained - ensure allocated datasets are available for Phase 4"
         
         # General recommendations
-        recommendations.extend([
-            "Implement automated retraining pipeline for continuous improvement",
-            "Set up data drift monitoring for incoming Malayalam conversations",
-            "Create feedback loop from production performance to training data curation"
-        ])
-        
-        return recommendations
+        yield "Implement automated retraining pipeline for continuous improvement"
+        yield "Set up data drift monitoring for incoming Malayalam conversations"
+        yield "Create feedback loop from production performance to training data curation"
 
     def _calculate_duration(self) -> str:
         """Calculate pipeline execution duration."""
-        start_time = datetime.fromisoformat(self.pipeline_stats["started_at"])
-        current_time = datetime.now()
-        duration = current_time - start_time
+        elapsed = int(time.monotonic() - self._started_monotonic)
         
-        hours, remainder = divmod(duration.seconds, 3600)
+        hours, remainder = divmod(elapsed, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+    async def _run_phase_after(self, phase: str, upstream: list, pipeline_report: dict):
+        """Run one phase once the phases it depends on have completed."""
+        if upstream:
+            await asyncio.gather(*upstream)
+        
+        log_message, executor_name = PHASE_STEPS[phase]
+        logger.info(log_message)
+        phase_report = await self._run_phase_cached(phase, getattr(self, executor_name))
+        pipeline_report["phase_reports"][phase] = phase_report
+        await self._stream_report_record({"phase": phase, "report": phase_report})
+        self.pipeline_stats["phases_completed"].append(phase)
+
+    async def _stream_report_record(self, record: dict):
+        """Append one record to the streamed NDJSON pipeline report."""
+        # Concurrent phases must not interleave their lines
+        async with self._report_lock:
+            await asyncio.to_thread(self._append_ndjson_sync, self._report_path, record)
+
     async def _save_pipeline_report(self, report: dict):
         """Save comprehensive pipeline report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_path = self.base_path / f"pipeline_report_{timestamp}.json"
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Phase reports are already on disk; close the stream with the run-level results
+        await self._stream_report_record({
+            "execution_id": report["execution_id"],
+            "phases_requested": report["phases_requested"],
+            "overall_statistics": report["overall_statistics"],
+            "recommendations": report["recommendations"]
+        })
         
         # Also save a summary for quick reference
         summary_path = self.base_path / "latest_pipeline_summary.json"
         summary = {
             "execution_id": report["execution_id"],
-            "completed_at": self.pipeline_stats.get("completed_at", datetime.now().isoformat()),
+            "report_path": str(self._report_path),
+            "completed_at": self.pipeline_stats["completed_at"],
             "status": self.pipeline_stats["pipeline_status"],
             "phases_completed": self.pipeline_stats["phases_completed"],
             "datasets_processed": report["overall_statistics"]["total_datasets_processed"],
@@ -318,38 +525,67 @@ class DataFoundryMaster:
             "success_rate": report["overall_statistics"]["success_rate"]
         }
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        # Blocking file write runs in a worker thread so the event loop stays free
+        await asyncio.to_thread(self._write_json_sync, summary_path, summary)
+
+    @staticmethod
+    def _append_ndjson_sync(path: Path, record: dict):
+        """Blocking NDJSON appender; always invoked off the event loop via asyncio.to_thread."""
+        with open(path, 'ab') as f:
+            f.write(_json_dumps(record) + b"\n")
+
+    @staticmethod
+    def _write_json_sync(path: Path, payload: dict):
+        """Blocking JSON writer; always invoked off the event loop via asyncio.to_thread."""
+        # Write to a sibling temp file and rename so readers never see a partial report
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(payload, indent=True))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_json_sync(path: Path) -> dict:
+        """Blocking JSON reader; always invoked off the event loop via asyncio.to_thread."""
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
 
     def _print_pipeline_summary(self, report: dict):
         """Print comprehensive pipeline execution summary."""
-        print("\n" + "="*80)
-        print("🏭 DATA FOUNDRY MASTER PIPELINE COMPLETE")
-        print("="*80)
-        
         stats = report["overall_statistics"]
-        print(f"📊 Execution ID: {report['execution_id']}")
-        print(f"⏱️  Duration: {stats['pipeline_duration']}")
-        print(f"✅ Success Rate: {stats['success_rate']:.1f}%")
-        print(f"📦 Datasets Processed: {stats['total_datasets_processed']}")
-        print(f"🤖 Models Trained: {stats['total_models_trained']}")
-        
-        print(f"\n🔄 Phases Completed:")
-        for i, phase in enumerate(self.pipeline_stats["phases_completed"], 1):
-            print(f"   {i}. {phase.upper()}")
+        lines = [
+            f"\n{_BANNER}\n🏭 DATA FOUNDRY MASTER PIPELINE COMPLETE\n{_BANNER}",
+            f"📊 Execution ID: {report['execution_id']}",
+            f"⏱️  Duration: {stats['pipeline_duration']}",
+            f"✅ Success Rate: {stats['success_rate']:.1f}%",
+            f"📦 Datasets Processed: {stats['total_datasets_processed']}",
+            f"🤖 Models Trained: {stats['total_models_trained']}",
+            "\n🔄 Phases Completed:",
+        ]
+        lines.extend(
+            f"   {i}. {phase.upper()}"
+            for i, phase in enumerate(self.pipeline_stats["phases_completed"], 1)
+        )
         
         if report.get("recommendations"):
-            print(f"\n💡 Strategic Recommendations:")
-            for i, rec in enumerate(report["recommendations"][:5], 1):  # Show top 5
-                print(f"   {i}. {rec}")
-        
-        print(f"\n📁 Data Storage:")
-        for storage_type, path in self.storage_paths.items():
-            print(f"   {storage_type.upper()}: {path}")
-        
-        print(f"\n📋 Full Report: {self.base_path}/pipeline_report_*.json")
-        print("="*80)
-
+            lines.append("\n💡 Strategic Recommendations:")
+            lines.extend(
+                f"   {i}. {rec}"
+                for i, rec in enumerate(report["recommendations"][:5], 1)  # Show top 5
+            )
+        
+        lines.append("\n📁 Data Storage:")
+        lines.extend(
+            f"   {storage_type.upper()}: {path}"
+            for storage_type, path in self.storage_paths.items()
+        )
+        lines += [
+            f"\n📋 Full Report: {self.base_path}/pipeline_report_*.ndjson",
+            _BANNER,
+        ]
+        
+        # Emit the whole summary in one write instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def create_default_config() -> dict:
     """Create default configuration for Data Foundry pipeline."""
@@ -378,14 +614,14 @@ def create_default_config() -> dict:
     }
 
 
-async def main():
-    """Main execution function with CLI argument parsing."""
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Parse the command line; runs before any event loop exists."""
     parser = argparse.ArgumentParser(description="Data Foundry Master Pipeline")
     parser.add_argument(
         "--phases", 
         nargs='+', 
-        choices=["phase1", "phase2", "phase3", "phase4"],
-        default=["phase1", "phase2", "phase3", "phase4"],
+        choices=tuple(PHASE_STEPS),
+        default=list(PHASE_STEPS),
         help="Phases to execute"
     )
     parser.add_argument(
@@ -393,34 +629,43 @@ async def main():
         type=str,
         help="Path to configuration file"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every phase even if its inputs are unchanged"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Perform a dry run without actual execution"
     )
     
-    args = parser.parse_args()
-    
-    # Load configuration
+    return parser.parse_args(argv)
+
+
+def _load_config(args: argparse.Namespace) -> dict:
+    """Resolve the pipeline configuration from CLI arguments."""
+    # No event loop is running yet, so a plain blocking read is fine here
     if args.config and Path(args.config).exists():
-        with open(args.config, 'r') as f:
-            config = json.load(f)
+        config = _json_loads(Path(args.config).read_bytes())
     else:
         config = create_default_config()
     
-    # Dry run information
-    if args.dry_run:
-        print("🔍 DRY RUN MODE - No actual execution will occur")
-        print(f"📋 Phases to execute: {', '.join(args.phases)}")
-        print(f"📁 Base path: {config['base_path']}")
-        return
+    if args.no_cache:
+        config["phase_cache"] = False
     
+    return config
+
+
+async def _async_main(config: dict, phases: list) -> int:
+    """Run the pipeline inside the event loop."""
     # Initialize and run pipeline
+    master = None
     try:
         master = DataFoundryMaster(config)
         
         # Execute pipeline
-        report = await master.run_complete_pipeline(phases=args.phases)
+        report = await master.run_complete_pipeline(phases=phases)
         
         # Success
         logger.info("🎉 Data Foundry pipeline completed successfully!")
@@ -429,8 +674,30 @@ async def main():
     except Exception as e:
         logger.error(f"💥 Pipeline execution failed: {str(e)}")
         return 1
+    finally:
+        if master is not None:
+            await master.close()
+
+
+def main(argv=None) -> int:
+    """Main execution function with CLI argument parsing."""
+    args = _parse_args(argv)
+    config = _load_config(args)
+    
+    # Dry run only reports what would happen, so it never starts an event loop
+    if args.dry_run:
+        print("🔍 DRY RUN MODE - No actual execution will occur")
+        print(f"📋 Phases to execute: {', '.join(args.phases)}")
+        print(f"📁 Base path: {config['base_path']}")
+        return 0
+    
+    # Prefer uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_async_main(config, args.phases))
+    return uvloop.run(_async_main(config, args.phases))
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(main())
@@ -54,62 +54,63 @@ async def test_ai4bharat_models():
             "പരാതി രജിസ്റ്റർ ചെയ്യണം"
         ]
         
+        sentiment_texts = [
+            "വളരെ സന്തോഷമായി",  # Very happy
+            "എനിക്ക് വിഷമമാണ്",   # I'm sad
+            "ഇത് നല്ലതാണ്"      # This is good
+        ]
+        translation_texts = test_malayalam_texts[:2]  # Test first 2 samples
+        tts_test_text = "നമസ്കാരം, ഞാൻ നിങ്ങളുടെ ഡിജിറ്റൽ അസിസ്റ്റന്റ്"
+        
+        # The checks are independent of each other, so run them all concurrently
+        intent_results, translation_results, sentiment_results, tts_result = await asyncio.gather(
+            asyncio.gather(*[manager.understand_malayalam_intent(t) for t in test_malayalam_texts], return_exceptions=True),
+            asyncio.gather(*[manager.translate_to_english(t) for t in translation_texts], return_exceptions=True),
+            asyncio.gather(*[manager.analyze_sentiment(t) for t in sentiment_texts], return_exceptions=True),
+            manager.generate_malayalam_speech(tts_test_text),
+            return_exceptions=True
+        )
+        
         logger.info("🧠 Testing Malayalam Understanding:")
-        for text in test_malayalam_texts:
-            try:
-                intent_result = await manager.understand_malayalam_intent(text)
-                if intent_result.get('success'):
-                    logger.info(f"   ✅ '{text}' → Intent: {intent_result.get('intent', 'unknown')}")
-                else:
-                    logger.warning(f"   ⚠️ Intent analysis failed for: '{text}'")
-            except Exception as e:
-                logger.error(f"   ❌ Error analyzing: '{text}' - {e}")
+        for text, intent_result in zip(test_malayalam_texts, intent_results):
+            if isinstance(intent_result, Exception):
+                logger.error(f"   ❌ Error analyzing: '{text}' - {intent_result}")
+            elif intent_result.get('success'):
+                logger.info(f"   ✅ '{text}' → Intent: {intent_result.get('intent', 'unknown')}")
+            else:
+                logger.warning(f"   ⚠️ Intent analysis failed for: '{text}'")
         
         # Test translation capability
         logger.info("🌐 Testing Translation:")
-        for text in test_malayalam_texts[:2]:  # Test first 2 samples
-            try:
-                translation_result = await manager.translate_to_english(text)
-                if translation_result.get('success'):
-                    logger.info(f"   ✅ '{text}' → '{translation_result.get('translated_text')}'")
-                else:
-                    logger.warning(f"   ⚠️ Translation failed for: '{text}'")
-            except Exception as e:
-                logger.error(f"   ❌ Translation error: '{text}' - {e}")
+        for text, translation_result in zip(translation_texts, translation_results):
+            if isinstance(translation_result, Exception):
+                logger.error(f"   ❌ Translation error: '{text}' - {translation_result}")
+            elif translation_result.get('success'):
+                logger.info(f"   ✅ '{text}' → '{translation_result.get('translated_text')}'")
+            else:
+                logger.warning(f"   ⚠️ Translation failed for: '{text}'")
         
         # Test sentiment analysis
         logger.info("😊 Testing Sentiment Analysis:")
-        sentiment_texts = [
-            "വളരെ സന്തോഷമായി",  # Very happy
-            "എനിക്ക് വിഷമമാണ്",   # I'm sad
-            "ഇത് നല്ലതാണ്"      # This is good
-        ]
-        
-        for text in sentiment_texts:
-            try:
-                sentiment_result = await manager.analyze_sentiment(text)
-                if sentiment_result.get('success'):
-                    logger.info(f"   ✅ '{text}' → {sentiment_result.get('sentiment')} ({sentiment_result.get('confidence', 0):.3f})")
-                else:
-                    logger.warning(f"   ⚠️ Sentiment analysis failed for: '{text}'")
-            except Exception as e:
-                logger.error(f"   ❌ Sentiment error: '{text}' - {e}")
+        for text, sentiment_result in zip(sentiment_texts, sentiment_results):
+            if isinstance(sentiment_result, Exception):
+                logger.error(f"   ❌ Sentiment error: '{text}' - {sentiment_result}")
+            elif sentiment_result.get('success'):
+                logger.info(f"   ✅ '{text}' → {sentiment_result.get('sentiment')} ({sentiment_result.get('confidence', 0):.3f})")
+            else:
+                logger.warning(f"   ⚠️ Sentiment analysis failed for: '{text}'")
         
         # Test TTS generation
         logger.info("🔊 Testing Malayalam Speech Generation:")
-        tts_test_text = "നമസ്കാരം, ഞാൻ നിങ്ങളുടെ ഡിജിറ്റൽ അസിസ്റ്റന്റ്"
-        
-        try:
-            tts_result = await manager.generate_malayalam_speech(tts_test_text)
-            if tts_result.get('success'):
-                if tts_result.get('audio_generated'):
-                    logger.info(f"   ✅ AI4Bharat TTS Generated: {tts_result.get('audio_path')}")
-                else:
-                    logger.info(f"   ℹ️ TTS Ready but audio not generated: {tts_result.get('note')}")
+        if isinstance(tts_result, Exception):
+            logger.error(f"   ❌ TTS error: {tts_result}")
+        elif tts_result.get('success'):
+            if tts_result.get('audio_generated'):
+                logger.info(f"   ✅ AI4Bharat TTS Generated: {tts_result.get('audio_path')}")
             else:
-                logger.warning(f"   ⚠️ TTS generation failed: {tts_result.get('error')}")
-        except Exception as e:
-            logger.error(f"   ❌ TTS error: {e}")
+                logger.info(f"   ℹ️ TTS Ready but audio not generated: {tts_result.get('note')}")
+        else:
+            logger.warning(f"   ⚠️ TTS generation failed: {tts_result.get('error')}")
         
         # Summary
         successful_models = sum(initialization_results.values())
@@ -5,10 +5,17 @@ Tests model loading and basic functionality
 """
 
 import asyncio
+import importlib.util
 import logging
+import os
 import time
 from pathlib import Path
 
+# Use the Rust multi-connection downloader for model weights when it is installed.
+# huggingface_hub reads the flag at import time, so set it before malayalam_models loads
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Model families this test loads and exercises; STT and TTS are not checked here
+TESTED_MODELS = ('nlu', 'translation', 'sentiment')
+
 async def test_malayalam_models():
     """Test the Malayalam models integration"""
     
@@ -24,7 +34,7 @@ async def test_malayalam_models():
     
     try:
         # Import after setting up the environment
-        from malayalam_models import MalayalamModelManager, ModelConfig
+        from malayalam_models import ModelConfig, get_or_create_manager
         
         # Initialize with config
         config = ModelConfig()
@@ -32,15 +42,16 @@ async def test_malayalam_models():
         print(f"📁 Cache Directory: {config.cache_dir}")
         print()
         
-        # Create model manager
+        # Create model manager and load only the models this test exercises; STT and TTS
+        # stay unloaded (reused if already loaded in this process)
         print("🔧 Initializing Malayalam Model Manager...")
-        model_manager = MalayalamModelManager(config)
-        
-        # Load models
         print("⬇️  Loading pre-trained models...")
         start_time = time.time()
         
-        initialization_results = await model_manager.initialize_models()
+        model_manager = await get_or_create_manager(config, models=TESTED_MODELS)
+        initialization_results = {
+            name: model_manager.initialization_results.get(name, False) for name in TESTED_MODELS
+        }
         
         load_time = time.time() - start_time
         print(f"⏱️  Model loading completed in {load_time:.2f} seconds")
@@ -70,62 +81,69 @@ async def test_malayalam_models():
             # Test text analysis (basic)
             test_malayalam_text = "ഹലോ, എനിക്ക് ഒരു പരാതിയുണ്ട്"  # "Hello, I have a complaint"
             
-            try:
-                if initialization_results.get('nlu', False):
-                    print(f"📝 Testing intent analysis with: '{test_malayalam_text}'")
-                    intent_result = await model_manager.understand_malayalam_intent(test_malayalam_text)
-                    if intent_result.get('success'):
-                        print(f"✅ Intent detected: {intent_result['intent']} (confidence: {intent_result['confidence']:.3f})")
-                    else:
-                        print(f"⚠️  Intent analysis had issues: {intent_result.get('error', 'Unknown error')}")
+            # The three analyses are independent, so run them concurrently
+            checks = {
+                'nlu': model_manager.understand_malayalam_intent,
+                'translation': model_manager.translate_to_english,
+                'sentiment': model_manager.analyze_sentiment
+            }
+            loaded_checks = [name for name in checks if initialization_results.get(name, False)]
+            check_results = dict(zip(loaded_checks, await asyncio.gather(
+                *(checks[name](test_malayalam_text) for name in loaded_checks),
+                return_exceptions=True
+            )))
+            
+            intent_result = check_results.get('nlu')
+            if intent_result is None:
+                print("⏭️  Skipping intent analysis (NLU model not loaded)")
+            elif isinstance(intent_result, Exception):
+                print(f"❌ Intent analysis test failed: {intent_result}")
+            else:
+                print(f"📝 Testing intent analysis with: '{test_malayalam_text}'")
+                if intent_result.get('success'):
+                    print(f"✅ Intent detected: {intent_result['intent']} (confidence: {intent_result['confidence']:.3f})")
                 else:
-                    print("⏭️  Skipping intent analysis (NLU model not loaded)")
-                    
-            except Exception as e:
-                print(f"❌ Intent analysis test failed: {e}")
+                    print(f"⚠️  Intent analysis had issues: {intent_result.get('error', 'Unknown error')}")
             
-            try:
-                if initialization_results.get('translation', False):
-                    print(f"🌐 Testing translation...")
-                    translation_result = await model_manager.translate_to_english(test_malayalam_text)
-                    if translation_result.get('success'):
-                        print(f"✅ Translation: {translation_result['translated_text']}")
-                    else:
-                        print(f"⚠️  Translation had issues: {translation_result.get('error', 'Unknown error')}")
+            translation_result = check_results.get('translation')
+            if translation_result is None:
+                print("⏭️  Skipping translation (Translation model not loaded)")
+            elif isinstance(translation_result, Exception):
+                print(f"❌ Translation test failed: {translation_result}")
+            else:
+                print(f"🌐 Testing translation...")
+                if translation_result.get('success'):
+                    print(f"✅ Translation: {translation_result['translated_text']}")
                 else:
-                    print("⏭️  Skipping translation (Translation model not loaded)")
-                    
-            except Exception as e:
-                print(f"❌ Translation test failed: {e}")
+                    print(f"⚠️  Translation had issues: {translation_result.get('error', 'Unknown error')}")
             
-            try:
-                if initialization_results.get('sentiment', False):
-                    print(f"😊 Testing sentiment analysis...")
-                    sentiment_result = await model_manager.analyze_sentiment(test_malayalam_text)
-                    if sentiment_result.get('success'):
-                        print(f"✅ Sentiment: {sentiment_result['sentiment']} (confidence: {sentiment_result['confidence']:.3f})")
-                    else:
-                        print(f"⚠️  Sentiment analysis had issues: {sentiment_result.get('error', 'Unknown error')}")
+            sentiment_result = check_results.get('sentiment')
+            if sentiment_result is None:
+                print("⏭️  Skipping sentiment analysis (Sentiment model not loaded)")
+            elif isinstance(sentiment_result, Exception):
+                print(f"❌ Sentiment analysis test failed: {sentiment_result}")
+            else:
+                print(f"😊 Testing sentiment analysis...")
+                if sentiment_result.get('success'):
+                    print(f"✅ Sentiment: {sentiment_result['sentiment']} (confidence: {sentiment_result['confidence']:.3f})")
                 else:
-                    print("⏭️  Skipping sentiment analysis (Sentiment model not loaded)")
-                    
-            except Exception as e:
-                print(f"❌ Sentiment analysis test failed: {e}")
+                    print(f"⚠️  Sentiment analysis had issues: {sentiment_result.get('error', 'Unknown error')}")
         
         print()
         print("🎯 DEPLOYMENT ASSESSMENT:")
         print("-" * 40)
         
-        if successful_models >= 3:
-            print("🟢 EXCELLENT: Ready for production deployment")
-            print("   • Multiple models loaded successfully")
-            print("   • Full Malayalam processing capability")
-            print("   • Recommended: Deploy to staging for integration testing")
+        if successful_models == total_models:
+            print("🟢 GOOD: Text models ready for staging")
+            print(f"   • All tested models loaded successfully ({', '.join(TESTED_MODELS)})")
+            print("   • Malayalam text processing capability (NLU, translation, sentiment)")
+            print("   • STT and TTS were not exercised - verify speech models before production")
             
         elif successful_models >= 1:
-            print("🟡 GOOD: Partial deployment possible")
-            print("   • Some models loaded successfully")  
-            print("   • Limited Malayalam processing capability")
+            print("🟡 PARTIAL: Some text models loaded")
+            print("   • Some tested models loaded successfully")  
+            print("   • Limited Malayalam text processing capability")
+            print("   • STT and TTS were not exercised")
             print("   • Recommended: Review failed models and retry")
             
         else:
@@ -5,8 +5,16 @@ Immediate deployment with publicly available models
 """
 
 import asyncio
+import importlib.util
 import logging
-from malayalam_models import MalayalamModelManager, ModelConfig
+import os
+
+# Use the Rust multi-connection downloader for model weights when it is installed.
+# huggingface_hub reads the flag at import time, so set it before malayalam_models loads
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from malayalam_models import ModelConfig, get_or_create_manager
 from human_conversation_system import HumanLikeConversationSystem
 
 logging.basicConfig(level=logging.INFO)
@@ -33,13 +41,12 @@ async def test_open_models():
     logger.info(f"   Sentiment: {config.sentiment_model}")
     logger.info(f"   TTS: {config.tts_model}")
     
-    # Initialize model manager
-    manager = MalayalamModelManager(config)
     conversation_system = HumanLikeConversationSystem()
     
-    # Initialize models
+    # Initialize model manager and models (reused if already loaded in this process)
     logger.info("🔄 Loading open models...")
-    results = await manager.initialize_models()
+    manager = await get_or_create_manager(config)
+    results = manager.initialization_results
     
     # Display results
     success_count = sum(results.values())